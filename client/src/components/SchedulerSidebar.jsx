@@ -83,14 +83,24 @@ const StudentInfo = ({ studentInfo, selectedCourses }) => {
         }
     };
 
-    const uploadCourseGroupings = async () => {
+    const uploadCourseGroupings = async (allowConflicts = false) => {
         const groupingIds = selectedCourses.map(course => course.groupingId);
         try {
-            const response = await axios.put(`${import.meta.env.VITE_SERVER_URL}/api/student/replace-course-groupings/${studentInfo.id}`, { "course_groupings": groupingIds },{ withCredentials: true });
+            const response = await axios.put(`${import.meta.env.VITE_SERVER_URL}/api/student/replace-course-groupings/${studentInfo.id}`, { "course_groupings": groupingIds, "allow_conflicts": allowConflicts },{ withCredentials: true });
             if (response.status === 200) {
                 console.log('Course groupings uploaded successfully');
             }
         } catch (error) {
+            if (error.response && error.response.status === 409) {
+                // Overlapping timetables are allowed, but only once the advisor has seen the conflicts
+                const conflicts = error.response.data.conflicts.map(conflict =>
+                    `${conflict.course_groupings.join(' and ')}: ${conflict.day} ${conflict.begin_time} - ${conflict.end_time}`
+                );
+                if (window.confirm(`These course groupings have time conflicts:\n\n${conflicts.join('\n')}\n\nSave them anyway?`)) {
+                    await uploadCourseGroupings(true);
+                }
+                return;
+            }
             console.error('Error uploading course groupings:', error);
         }
     };
@@ -168,7 +178,7 @@ const StudentInfo = ({ studentInfo, selectedCourses }) => {
             {/* Save Button */}
             <div className="mt-4 flex justify-center">
                 <button
-                    onClick={uploadCourseGroupings}
+                    onClick={() => uploadCourseGroupings()}
                     className="rounded-sm w-48 px-4 py-2 font-bold text-sm text-white duration-300 text-center bg-green-600 hover:bg-green-500"
                 >
                     Save
@@ -187,12 +197,39 @@ const CourseList = ({ studentInfo, onSelectedCoursesChange }) => {
                 isOpen: false,
                 selectedGrouping: '',
                 isLoading: false,
+                isLoaded: false,
                 groupings: {},
             };
             return acc;
         }, {})
     );
 
+    useEffect(() => {
+        const fetchAllGroupings = async () => {
+            try {
+                const response = await axios.get(
+                    `${import.meta.env.VITE_SERVER_URL}/api/course/get-all-course-groupings-by-student/${studentInfo.id}`,
+                    { withCredentials: true }
+                );
+                setCoursesState((prevState) => {
+                    const nextState = { ...prevState };
+                    Object.entries(response.data).forEach(([courseCode, groupingsData]) => {
+                        if (!nextState[courseCode] || nextState[courseCode].isLoaded) return;
+                        nextState[courseCode] = {
+                            ...nextState[courseCode],
+                            groupings: groupingsData,
+                            isLoaded: true,
+                        };
+                    });
+                    return nextState;
+                });
+            } catch (error) {
+                console.error("Error fetching groupings:", error);
+            }
+        };
+        fetchAllGroupings();
+    }, [studentInfo.id]);
+
     const allSelectedGroupingsHaveSchedules = () => {
         return Object.entries(coursesState).every(([courseCode, state]) => {
             const selectedGrouping = state.selectedGrouping;
@@ -248,7 +285,15 @@ const CourseList = ({ studentInfo, onSelectedCoursesChange }) => {
             },
         }));
 
-        if (!coursesState[courseCode].isOpen) {
+        if (!coursesState[courseCode].isOpen && coursesState[courseCode].isLoaded) {
+            setCoursesState((prevState) => ({
+                ...prevState,
+                [courseCode]: {
+                    ...prevState[courseCode],
+                    selectedGrouping: prevState[courseCode].selectedGrouping || Object.keys(prevState[courseCode].groupings)[0] || '',
+                },
+            }));
+        } else if (!coursesState[courseCode].isOpen) {
             setCoursesState((prevState) => ({
                 ...prevState,
                 [courseCode]: { ...prevState[courseCode], isLoading: true },
@@ -268,6 +313,7 @@ const CourseList = ({ studentInfo, onSelectedCoursesChange }) => {
                         groupings: groupingsData,
                         selectedGrouping: prevState[courseCode].selectedGrouping || Object.keys(groupingsData)[0] || '',
                         isLoading: false,
+                        isLoaded: true,
                     },
                 }));
 
@@ -34,6 +34,8 @@ def login() -> tuple:
         password = request.json.get('password')
         user = db.get_user_by_email(email)
         authenticator.verify_password(password, user.password)
+        if authenticator.needs_rehash(user.password):
+            db.rehash_password(user, authenticator.encrypt_password(password))
         session.permanent = True
         session["user_id"] = user.id
         return jsonify({"message": "login successful"}), 200
@@ -27,7 +27,39 @@ def get_all_course_groupings_by_course_code(course_code, student_id):
     except Exception as e:
         return jsonify({"message": str(e)}), 404
 
-    
+
+@course_bp.route('/course/get-all-course-groupings-by-student/<string:student_id>', methods=['GET'])
+@verified_login_required
+def get_all_course_groupings_by_student(student_id):
+    """
+    Request: GET /course/get-all-course-groupings-by-student/<string:student_id>
+
+    Description: Retrieve the available course groupings for several course codes in one request.
+
+    Parameters:
+    - student_id (string): The student ID.
+
+    Query Parameters:
+    - course_codes (string, optional): Comma separated course codes. Defaults to the student's preferences.
+
+    Response:
+    - object: For each course code, the courses of each available grouping, keyed by course grouping.
+
+    Status Codes:
+    - 200: Course groupings successfully retrieved.
+    - 404: Student not found or groupings could not be retrieved.
+    """
+    try:
+        db = current_app.config['database']
+        course_codes = request.args.get('course_codes')
+        if course_codes:
+            response = db.get_course_groupings_by_course_codes(course_codes.split(','), student_id)
+        else:
+            response = db.get_course_groupings_by_student_preferences(student_id)
+        return jsonify(response), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 404
+
 @course_bp.route('/course/course_grouping/<string:course_grouping>/', methods=['GET'])
 @verified_login_required
 def get_course_by_course_grouping(course_grouping):
@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, request, current_app, session
 
 from services.decorators import verified_login_required
+from services.Database import POPULAR_COURSES_DEFAULT_LIMIT
 
 
 # DEFINE BLUEPRINT
@@ -36,7 +37,10 @@ def get_most_popular_preferences():
     """
     try:
         db = current_app.config['database']
-        response = db.get_most_popular_preferences()
+        response = db.get_most_popular_preferences(
+            limit=request.args.get('limit', POPULAR_COURSES_DEFAULT_LIMIT, type=int),
+            term_code=request.args.get('term_code', type=int)
+        )
         return jsonify(response), 200
     except Exception as e:
         return jsonify({"error": "Internal server error", "message": str(e)}), 500
@@ -47,7 +51,10 @@ def get_most_popular_course_registrations():
     """
     try:
         db = current_app.config['database']
-        response = db.get_most_popular_course_registrations()
+        response = db.get_most_popular_course_registrations(
+            limit=request.args.get('limit', POPULAR_COURSES_DEFAULT_LIMIT, type=int),
+            term_code=request.args.get('term_code', type=int)
+        )
         return jsonify(response), 200
     except Exception as e:
         return jsonify({"error": "Internal server error", "message": str(e)}), 500
\ No newline at end of file
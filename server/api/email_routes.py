@@ -36,7 +36,8 @@ def test_email() -> tuple:
         email_manager.send_verification_email(
             to_email=test_email,
             username="Test User",
-            verification_code="123456"
+            verification_code="123456",
+            background=False
         )
         return jsonify({"message": "Test email sent successfully"}), 200
     except Exception as e:
@@ -0,0 +1,278 @@
+"""
+This module defines the routes for running imports and exports as background jobs.
+"""
+
+# IMPORTS
+from flask import Blueprint, jsonify, request, current_app, send_file
+
+from services.decorators import verified_login_required
+from services.JobManager import JOB_COMPLETED
+from exceptions import JobNotFound
+
+
+# DEFINE BLUEPRINT
+job_bp = Blueprint('job_bp', __name__)
+
+
+# HELPERS
+def submit_job(job_type: str, file=None) -> tuple:
+    """
+    Queue a background job and build the response for it.
+
+    Args
+    ----
+    job_type (str): The type of the job, one of the keys of JOB_TASKS.
+    file (FileStorage): The uploaded file to hand to the task.
+
+    Returns
+    -------
+    response (tuple): The response tuple containing the job ID and status code.
+    """
+    job_manager = current_app.config['job_manager']
+    job_id = job_manager.submit(job_type, file)
+    return jsonify({"message": "Job queued", "job_id": job_id}), 202
+
+
+# TASKS
+def replace_courses(job_id: str, file, progress: callable) -> list:
+    """
+    Replace all course data with an uploaded XLSX file.
+    """
+    return current_app.config['database'].bulk_course_replace(file, progress)
+
+
+def update_courses(job_id: str, file, progress: callable) -> list:
+    """
+    Apply an uploaded XLSX file as an update to the course data.
+    """
+    return current_app.config['database'].bulk_course_update(file, progress)
+
+
+def replace_students(job_id: str, file, progress: callable) -> list:
+    """
+    Replace all student data with an uploaded CSV file.
+    """
+    return current_app.config['database'].bulk_student_replace(file, progress)
+
+
+def update_students(job_id: str, file, progress: callable) -> dict:
+    """
+    Apply an uploaded CSV file as an update to the student data.
+    """
+    return current_app.config['database'].bulk_student_update(file, progress)
+
+
+def export_schedules(job_id: str, file, progress: callable) -> str:
+    """
+    Export all student schedules to the job's own CSV file in the jobs folder.
+    """
+    file_path = current_app.config['job_manager'].output_path(job_id)
+    return current_app.config['database'].save_schedules_to_local_file(progress=progress, file_path=file_path)
+
+
+def auto_schedule_students(job_id: str, file, progress: callable) -> dict:
+    """
+    Assign course groupings to every student still waiting for a schedule.
+    """
+    db = current_app.config['database']
+    return db.auto_schedule_students(current_app.config['studentManager'], progress=progress)
+
+
+JOB_TASKS = {
+    "course_replace": replace_courses,
+    "course_update": update_courses,
+    "student_replace": replace_students,
+    "student_update": update_students,
+    "schedule_export": export_schedules,
+    "auto_schedule": auto_schedule_students,
+}
+
+
+# ROUTES
+@job_bp.route('/job/course/import', methods=['PUT'])
+@verified_login_required
+def bulk_replace_courses_job():
+    """
+    Request: PUT /job/course/import
+
+    Description: Queue a background job replacing all course data with an uploaded XLSX file.
+
+    Request Body:
+    - file: XLSX file containing course data.
+
+    Response:
+    - job_id: The ID used to poll the job.
+
+    Status Codes:
+    - 202: Job queued.
+    - 400: Invalid request.
+    """
+    try:
+        return submit_job("course_replace", request.files['file'])
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/course/import', methods=['PATCH'])
+@verified_login_required
+def bulk_update_courses_job():
+    """
+    Request: PATCH /job/course/import
+
+    Description: Queue a background job applying an uploaded XLSX file as an update to the course data.
+
+    Request Body:
+    - file: XLSX file containing course data.
+
+    Response:
+    - job_id: The ID used to poll the job.
+
+    Status Codes:
+    - 202: Job queued.
+    - 400: Invalid request.
+    """
+    try:
+        return submit_job("course_update", request.files['file'])
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/student/import', methods=['PUT'])
+@verified_login_required
+def bulk_replace_students_job():
+    """
+    Request: PUT /job/student/import
+
+    Description: Queue a background job replacing all student data with an uploaded CSV file.
+
+    Request Body:
+    - file: CSV file containing student data.
+
+    Response:
+    - job_id: The ID used to poll the job.
+
+    Status Codes:
+    - 202: Job queued.
+    - 400: Invalid request.
+    """
+    try:
+        return submit_job("student_replace", request.files['file'])
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/student/import', methods=['PATCH'])
+@verified_login_required
+def bulk_update_students_job():
+    """
+    Request: PATCH /job/student/import
+
+    Description: Queue a background job applying an uploaded CSV file as an update to the student data.
+
+    Request Body:
+    - file: CSV file containing student data.
+
+    Response:
+    - job_id: The ID used to poll the job.
+
+    Status Codes:
+    - 202: Job queued.
+    - 400: Invalid request.
+    """
+    try:
+        return submit_job("student_update", request.files['file'])
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/schedule/export', methods=['POST'])
+@verified_login_required
+def export_schedules_job():
+    """
+    Request: POST /job/schedule/export
+
+    Description: Queue a background job exporting all student schedules to a CSV file.
+
+    Response:
+    - job_id: The ID used to poll the job and download the file once completed.
+
+    Status Codes:
+    - 202: Job queued.
+    - 400: Invalid request.
+    """
+    try:
+        return submit_job("schedule_export")
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/schedule/auto', methods=['POST'])
+@verified_login_required
+def auto_schedule_students_job():
+    """
+    Request: POST /job/schedule/auto
+
+    Description: Queue a background job assigning course groupings to every student still waiting for a schedule.
+
+    Response:
+    - job_id: The ID used to poll the job. The job result lists the unplaced preferences of each student.
+
+    Status Codes:
+    - 202: Job queued.
+    - 400: Invalid request.
+    """
+    try:
+        return submit_job("auto_schedule")
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/<string:job_id>', methods=['GET'])
+@verified_login_required
+def get_job(job_id):
+    """
+    Request: GET /job/<string:job_id>
+
+    Description: Retrieve the status, progress counts (rows parsed, rows inserted, invalid rows) and result of a job.
+
+    Parameters:
+    - job_id (string): The job ID.
+
+    Response:
+    - job (object): The job information.
+
+    Status Codes:
+    - 200: Job retrieved.
+    - 404: Job not found.
+    """
+    try:
+        job_manager = current_app.config['job_manager']
+        return jsonify(job_manager.get_job(job_id)), 200
+    except JobNotFound as e:
+        return jsonify({"message": str(e)}), 404
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@job_bp.route('/job/<string:job_id>/download', methods=['GET'])
+@verified_login_required
+def download_job_file(job_id):
+    """
+    Request: GET /job/<string:job_id>/download
+
+    Description: Download the file produced by a completed export job.
+
+    Parameters:
+    - job_id (string): The job ID.
+
+    Response:
+    - file: The exported file.
+
+    Status Codes:
+    - 200: File downloaded.
+    - 404: Job not found.
+    - 409: Job has not completed or did not produce a file.
+    """
+    try:
+        job_manager = current_app.config['job_manager']
+        job = job_manager.get_job(job_id)
+        if job["status"] != JOB_COMPLETED or job["type"] != "schedule_export":
+            return jsonify({"message": "Job has no file to download"}), 409
+        return send_file(job_manager.output_path(job_id), as_attachment=True, download_name="schedule.csv"), 200
+    except JobNotFound as e:
+        return jsonify({"message": str(e)}), 404
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
@@ -2,10 +2,11 @@
 """
 
 # IMPORTS
-from flask import Blueprint, jsonify, request, current_app, send_file
+from flask import Blueprint, jsonify, request, current_app, send_file, after_this_request
 import os
 
 from services.decorators import verified_login_required
+from services.Scheduler import DEFAULT_SCHEDULE_COUNT
 
 
 # DEFINE BLUEPRINT
@@ -21,6 +22,71 @@ def download_schedules():
     try:
         db = current_app.config['database']
         file_path = db.save_schedules_to_local_file()
-        return send_file(file_path, as_attachment=True), 200
+
+        @after_this_request
+        def remove_export(response):
+            os.remove(file_path)
+            return response
+
+        return send_file(file_path, as_attachment=True, download_name="schedule.csv"), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+
+@schedule_bp.route('/schedule/conflicts', methods=['POST'])
+@verified_login_required
+def find_schedule_conflicts():
+    """
+    Request: POST /schedule/conflicts
+
+    Description: Find the time conflicts between a set of course groupings.
+
+    Request Body:
+    - course_groupings (list): The course groupings to check.
+
+    Response:
+    - conflicts (list): The overlapping meetings, with their day, time window, course groupings and course IDs.
+
+    Status Codes:
+    - 200: Conflicts successfully checked.
+    - 400: Invalid request.
+    """
+    try:
+        db = current_app.config['database']
+        scheduler = current_app.config['studentManager']
+        course_groupings = request.get_json()['course_groupings']
+        conflicts = scheduler.find_grouping_conflicts(db.get_time_grids(course_groupings), db.get_courses_by_course_groupings)
+        return jsonify({"conflicts": conflicts}), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+
+@schedule_bp.route('/schedule/generate/<string:student_id>', methods=['GET'])
+@verified_login_required
+def generate_schedules(student_id):
+    """
+    Request: GET /schedule/generate/<string:student_id>
+
+    Description: Generate the best conflict-free schedules for a student from their ranked preferences.
+
+    Parameters:
+    - student_id (string): The student ID.
+
+    Query Parameters:
+    - count (int, optional): The maximum number of schedules to return (default 5).
+
+    Response:
+    - schedules (list): The schedules, best first, each with its course groupings and unplaced course codes.
+
+    Status Codes:
+    - 200: Schedules successfully generated.
+    - 400: Invalid request.
+    """
+    try:
+        db = current_app.config['database']
+        scheduler = current_app.config['studentManager']
+        groupings = db.get_course_groupings_by_student_preferences(student_id)
+        count = request.args.get('count', DEFAULT_SCHEDULE_COUNT, type=int)
+        return jsonify({"schedules": scheduler.generate_schedules(groupings, count)}), 200
     except Exception as e:
         return jsonify({"message": str(e)}), 400
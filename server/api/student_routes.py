@@ -5,6 +5,7 @@
 from flask import Blueprint, jsonify, request, current_app, send_file
 
 from services.decorators import verified_login_required
+from services.Database import STUDENT_PAGE_DEFAULT_LIMIT
 import os
 
 
@@ -12,6 +13,28 @@ import os
 student_bp = Blueprint("student_bp", __name__)
 
 
+# HELPERS
+def parse_bool_arg(value: str) -> bool:
+    """
+    Parse a boolean query string argument.
+
+    Args
+    ----
+    value (str): The argument value, "true" or "false" (case insensitive).
+
+    Returns
+    -------
+    bool: The parsed value.
+
+    Raises
+    ------
+    ValueError: If the value is not "true" or "false".
+    """
+    if value.lower() not in ("true", "false"):
+        raise ValueError(f"Invalid boolean: {value}")
+    return value.lower() == "true"
+
+
 # ROUTES
 @student_bp.route("/student/<string:id>/", methods=["GET"])
 @verified_login_required
@@ -178,6 +201,9 @@ def get_all_students():
 
     Description: Retrieve all students.
 
+    Query Parameters:
+    - fields (string, optional): Comma separated student fields to include, e.g. "id,first_name,preferences".
+
     Response:
     - students (list): A list of all students.
 
@@ -189,7 +215,48 @@ def get_all_students():
     """
     try:
         db = current_app.config["database"]
-        response = db.get_all_students()
+        fields = request.args.get("fields")
+        response = db.get_all_students(tuple(fields.split(",")) if fields else None)
+        return jsonify(response), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 400
+
+@student_bp.route("/student/list", methods=["GET"])
+@verified_login_required
+def get_students_page():
+    """
+    Request: GET /student/list
+
+    Description: Retrieve one page of students, ordered by ID, without nested course data.
+
+    Query Parameters:
+    - cursor (string, optional): The next_cursor of the previous page.
+    - limit (int, optional): The page size (default 50, max 200).
+    - term_code (int, optional): Only students in this term.
+    - is_completed (bool, optional): Only students with this completion status.
+    - is_approved_by_program_heads (bool, optional): Only students with this approval status.
+    - has_courses (bool, optional): Only students with (true) or without (false) enrolled courses.
+    - preference (string, optional): Only students with this course code among their preferences.
+
+    Response:
+    - students (list): The students on the page.
+    - next_cursor (string): The cursor of the next page, or null on the last page.
+
+    Status Codes:
+    - 200: Student data successfully retrieved.
+    - 400: Invalid request.
+    """
+    try:
+        db = current_app.config["database"]
+        response = db.get_students_page(
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", STUDENT_PAGE_DEFAULT_LIMIT, type=int),
+            term_code=request.args.get("term_code", type=int),
+            is_completed=request.args.get("is_completed", type=parse_bool_arg),
+            is_approved_by_program_heads=request.args.get("is_approved_by_program_heads", type=parse_bool_arg),
+            has_courses=request.args.get("has_courses", type=parse_bool_arg),
+            preference=request.args.get("preference"),
+        )
         return jsonify(response), 200
     except Exception as e:
         return jsonify({"message": str(e)}), 400
@@ -221,10 +288,36 @@ def download_template():
 @verified_login_required
 def replace_courses_with_new_course_groupings(student_id):
     """
+    Request: PUT /student/replace-course-groupings/<string:student_id>
+
+    Description: Replace the course groupings a student is enrolled in.
+
+    Parameters:
+    - student_id (string): The student ID.
+
+    Request Body:
+    - course_groupings (list): The new course groupings.
+    - allow_conflicts (bool, optional): Save the groupings even if their meetings overlap.
+
+    Response:
+    - message (string): The response message indicating success or failure.
+    - conflicts (list): The overlapping meetings, if the groupings were rejected.
+
+    Status Codes:
+    - 200: Course groupings successfully replaced.
+    - 400: Invalid request.
+    - 409: The course groupings conflict with each other.
     """
     try:
         db = current_app.config["database"]
+        scheduler = current_app.config["studentManager"]
         data = request.get_json()
+        if not data.get("allow_conflicts"):
+            conflicts = scheduler.find_grouping_conflicts(
+                db.get_time_grids(data["course_groupings"]), db.get_courses_by_course_groupings
+            )
+            if conflicts:
+                return jsonify({"message": "Course groupings have time conflicts", "conflicts": conflicts}), 409
         db.remove_all_course_groupings(student_id)
         db.add_courses_by_groupings(student_id, data["course_groupings"])
         return jsonify({"message": "Course groupings added to student successfully"}), 200
@@ -11,13 +11,16 @@ from api.schedule_routes import schedule_bp
 from api.authentication_routes import authentication_bp
 from api.email_routes import email_bp
 from api.database_routes import database_bp
+from api.job_routes import job_bp, JOB_TASKS
 
 from services.Database import Database
-from services.Authenticator import Authenticator
+from services.Authenticator import Authenticator, BCRYPT_ROUNDS, MAX_CONCURRENT_HASHES
 from services.Scheduler import Scheduler
-from services.EmailManager import EmailManager
+from services.EmailManager import EmailManager, SMTP_HOST, SMTP_PORT
+from services.JobManager import JobManager
 
 from db_config import db, configure_db
+from models.DashboardStats import DashboardStats
 from session_config import configure_sessions
 from dotenv import load_dotenv
 import os
@@ -40,16 +43,25 @@ def create_app():
 
     # CONFIGURE SERVICES
     app.config['database'] = Database(db)
-    app.config['authenticator'] = Authenticator()
+    app.config['authenticator'] = Authenticator(
+        rounds=int(os.getenv('BCRYPT_ROUNDS', BCRYPT_ROUNDS)),
+        max_concurrent_hashes=int(os.getenv('MAX_CONCURRENT_HASHES', MAX_CONCURRENT_HASHES))
+    )
     app.config['studentManager'] = Scheduler()
     app.config['email_manager'] = EmailManager(
         gmail_user=os.getenv('GMAIL_EMAIL'),
         gmail_password=os.getenv('GMAIL_PASSWORD'),
-        client_url=CLIENT_URL
+        client_url=CLIENT_URL,
+        host=os.getenv('SMTP_HOST', SMTP_HOST),
+        port=int(os.getenv('SMTP_PORT', SMTP_PORT)),
+        use_ssl=os.getenv('SMTP_USE_SSL', 'true').lower() == 'true'
     )
+    app.config['job_manager'] = JobManager(os.path.join(app.root_path, 'jobs'))
 
     # DATABASE CONFIGURATION
     configure_db(app)
+    with app.app_context():
+        DashboardStats.__table__.create(bind=db.engine, checkfirst=True)
 
     # SESSION CONFIGURATION
     configure_sessions(app, db)
@@ -83,4 +95,8 @@ def create_app():
     app.register_blueprint(authentication_bp, url_prefix='/api')
     app.register_blueprint(email_bp, url_prefix='/api')
     app.register_blueprint(database_bp, url_prefix='/api')
+    app.register_blueprint(job_bp, url_prefix='/api')
+
+    # BACKGROUND JOBS
+    app.config['job_manager'].start(app, JOB_TASKS)
     return app, db
@@ -104,4 +104,36 @@ class UserNotFound(Exception):
         message (str): Exception message.
         """
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+
+class JobNotFound(Exception):
+    """
+    An error occurred if the background job is not found.
+    """
+    def __init__(self, message="Job not found"):
+        """
+        Constructor for JobNotFound class.
+
+        Args
+        ----
+        message (str): Exception message.
+        """
+        self.message = message
+        super().__init__(self.message)
+
+
+class EmailQueueFull(Exception):
+    """
+    An error occurred if the email queue has no room for another email.
+    """
+    def __init__(self, message="Too many emails are waiting to be sent, please try again later"):
+        """
+        Constructor for EmailQueueFull class.
+
+        Args
+        ----
+        message (str): Exception message.
+        """
+        self.message = message
+        super().__init__(self.message)
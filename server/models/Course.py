@@ -32,39 +32,3 @@ class Course(db.Model):
     instructor = db.Column(db.String(512), nullable=False)
 
     students = db.relationship('Student', secondary=enrollments, back_populates='courses')
-
-    def to_dict(self):
-        course = {
-            "id": self.id,
-            "status": self.status,
-            "block": self.block,
-            "crn": self.crn,
-            "course_grouping": self.course_grouping,
-            "course_code": self.course_code,
-            "course_type": self.course_type,
-            "day": self.day,
-            "building_room": self.building_room,
-            "max_capacity": self.max_capacity,
-            "num_enrolled": self.num_enrolled,
-            "is_full_time": self.is_full_time,
-            "term_code": self.term_code,
-            "instructor": self.instructor,
-            "students": [student.id for student in self.students]
-        }
-        try:
-            course["start_date"] = self.start_date.strftime("%Y-%m-%d")
-        except:
-            course["start_date"] = self.start_date
-        try:
-            course["end_date"] = self.end_date.strftime("%Y-%m-%d")
-        except:
-            course["end_date"] = self.end_date
-        try:
-            course["begin_time"] = self.begin_time.strftime("%H:%M")
-        except:
-            course["begin_time"] = self.begin_time
-        try:
-            course["end_time"] = self.end_time.strftime("%H:%M")
-        except:
-            course["end_time"] = self.end_time
-        return course
@@ -0,0 +1,17 @@
+"""
+"""
+
+# IMPORTS
+from db_config import db
+
+
+# DASHBOARD STATS DATA CLASS
+class DashboardStats(db.Model):
+    """
+    A single row of student counts, kept up to date by the Database methods that change them.
+    """
+    __tablename__ = 'dashboard_stats'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    total_students = db.Column(db.Integer, nullable=False, default=0)
+    students_with_courses = db.Column(db.Integer, nullable=False, default=0)
+    schedules_finalized = db.Column(db.Integer, nullable=False, default=0)
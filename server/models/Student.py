@@ -22,41 +22,3 @@ class Student(db.Model):
     courses = db.relationship(
         "Course", secondary=enrollments, back_populates="students"
     )
-
-    def to_dict(self):
-        student = {
-            "id": self.id,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "term_code": self.term_code,
-            "email": self.email,
-            "is_completed": self.is_completed,
-            "is_approved_by_program_heads": self.is_approved_by_program_heads,
-            "preferences": [course.preference for course in self.preferences],
-            "courses": {},
-            "course_codes": [],
-        }
-        for course in self.courses:
-            try:
-                course.start_date = course.start_date.strftime("%Y-%m-%d")
-            except:
-                course.start_date = str(course.start_date)
-            try:
-                course.end_date = course.end_date.strftime("%Y-%m-%d")
-            except:
-                course.end_date = str(course.end_date)
-            try:
-                course.begin_time = course.begin_time.strftime("%H:%M")
-            except:
-                course.begin_time = str(course.begin_time)
-            try:
-                course.end_time = course.end_time.strftime("%H:%M")
-            except:
-                course.end_time = str(course.end_time)
-        for course in self.courses:
-            if course.course_code in student["courses"]:
-                student["courses"][course.course_code][course.course_grouping].append(course.to_dict())
-            else:
-                student["courses"][course.course_code] = {course.course_grouping: [course.to_dict()]}
-                student["course_codes"].append(course.course_code)
-        return student
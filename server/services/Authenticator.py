@@ -4,25 +4,36 @@
 # IMPORTS
 import bcrypt
 import secrets
+import threading
 
 from exceptions import IncorrectPassword, InvalidOneTimeCode
 
 
+# CONSTANTS
+BCRYPT_ROUNDS = 12
+MAX_CONCURRENT_HASHES = 2
+
+
 # AUTHENTICATOR CLASS
 class Authenticator:
     """
     A class used to authenticate users, sessions, requests, and API keys.
+
+    bcrypt releases the GIL, so password hashing runs in the calling thread; a semaphore bounds how many hashes run
+    at once, so a burst of logins uses at most that many cores and the threads serving other requests are not held up.
     """
-    def __init__(self):
+    def __init__(self, rounds: int = BCRYPT_ROUNDS, max_concurrent_hashes: int = MAX_CONCURRENT_HASHES):
         """
         Initialize the Authenticator class.
 
         Args
         ----
-        None
+        rounds (int): The bcrypt work factor used for new hashes.
+        max_concurrent_hashes (int): The most passwords hashed or checked at the same time by this process.
         """
-        pass
-    
+        self.rounds = rounds
+        self.hashing_slots = threading.BoundedSemaphore(max_concurrent_hashes)
+
     def encrypt_password(self, password: str) -> str:
         """
         Encrypt a password.
@@ -35,8 +46,25 @@ class Authenticator:
         -------
         str: The encrypted password.
         """
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt)
+        with self.hashing_slots:
+            return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.rounds)).decode('utf-8')
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check whether a hash was made with a different work factor than the configured one.
+
+        Args
+        ----
+        hashed_password (str): The hashed password, e.g. "$2b$12$...".
+
+        Returns
+        -------
+        bool: True if the password should be hashed again, otherwise False.
+        """
+        try:
+            return int(hashed_password.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
 
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """
@@ -55,7 +83,9 @@ class Authenticator:
         ------
         IncorrectPassword: If the password is incorrect.
         """
-        if not bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8')):
+        with self.hashing_slots:
+            is_correct = bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+        if not is_correct:
             raise IncorrectPassword()
         return True
     
@@ -3,11 +3,17 @@
 
 # IMPORTS
 import pandas as pd
+import numpy as np
+import openpyxl
 import os
+import threading
+import time
+import uuid
 from flask import current_app
-from sqlalchemy import text, delete, insert, update
+from sqlalchemy import text, delete, insert, update, select, bindparam
 from datetime import datetime
-from sqlalchemy import or_, func, desc
+from sqlalchemy import or_, and_, case, func, desc
+from sqlalchemy.exc import IntegrityError
 
 from models.Course import Course
 from models.Student import Student
@@ -15,6 +21,9 @@ from models.Preferences import Preferences
 from models.Enrollments import enrollments
 from models.User import User
 from models.ScheduleProgression import ScheduleProgression
+from models.DashboardStats import DashboardStats
+from services.serializers import serialize_courses, serialize_students, COURSE_COLUMNS
+from services.Scheduler import Scheduler
 
 from exceptions import InvalidUploadFile, InvalidFileType, DataNotFound, DatabaseError, DataAlreadyExists, InvalidEmailAddress, EmailAddressAlreadyInUse, UserNotFound
 
@@ -33,6 +42,16 @@ DROP_COURSE_COLUMNS = [
     "Sort Order",
     "Time",
 ]
+COURSE_READ_CHUNK_SIZE = 5000
+COURSE_DIFF_KEY_COLUMNS = ["crn", "block", "day", "begin_time"]
+INSERT_CHUNK_SIZE = 1000
+STUDENT_PAGE_DEFAULT_LIMIT = 50
+STUDENT_PAGE_MAX_LIMIT = 200
+COURSE_OFFERINGS_MAX_AGE = 60
+USER_AUTH_FLAGS_MAX_AGE = 30
+DASHBOARD_STATS_ID = 1
+POPULAR_COURSES_DEFAULT_LIMIT = 5
+POPULAR_COURSES_MAX_LIMIT = 100
 
 
 # DATABASE CLASS
@@ -42,48 +61,204 @@ class Database:
     def __init__(self, db):
         """ """
         self.db = db
+        self.scheduler = Scheduler()
+        self.course_offerings = None
+        self.course_grouping_offerings = None
+        self.course_offerings_built_at = 0
+        self.course_offerings_lock = threading.RLock()
+        self.user_auth_flags = {}
+        self.user_auth_flags_lock = threading.Lock()
 
-    def bulk_course_update(self, file) -> list:
+    def bulk_course_update(self, file, progress: callable = None) -> list:
         """
         """
         if not file.filename.endswith(".xlsx"):
             raise InvalidFileType("Invalid file format. Please upload an XLSX file.")
         try:
             df = self.parse_bulk_course_upload_file(file)
+            if progress:
+                progress(rows_parsed=len(df))
             self.set_all_student_is_completed_and_is_approved_by_program_heads_to_false()
-            student_enrollments = self.get_enrollments_by_student()
-            self.upload_courses_to_database(df)
-            self.update_student_enrollments(student_enrollments)
+            return self.diff_courses_in_database(df, progress)
         except:
             raise InvalidUploadFile("Invalid file format. Error processing the file.")
+        finally:
+            self.invalidate_course_offerings()
 
-    def update_student_enrollments(self, student_enrollments: dict):
+    def diff_courses_in_database(self, df: pd.DataFrame, progress: callable = None) -> list:
         """
+        Apply only the differences between the uploaded timetable and the courses table.
+
+        Args:
+        -----
+        df (pd.DataFrame): The parsed DataFrame to apply.
+        progress (callable): Called with keyword counts (invalid_rows, rows_inserted) as the import advances.
+
+        Returns:
+        --------
+        list: A list of invalid rows.
+
+        Notes:
+        ------
+        1. Courses are matched on COURSE_DIFF_KEY_COLUMNS; repeated keys are matched in order of appearance.
+        2. Matched courses keep their ID and are only updated if a value changed (compared as strings, as stored).
+        3. Unmatched existing courses (and their enrollments) are deleted; unmatched uploaded courses are inserted.
+        4. Students enrolled in a course grouping are enrolled in any course newly inserted into that grouping.
+        5. num_enrolled is the uploaded "Act." count plus the course's enrollments in this system.
+        6. All changes are committed in one transaction.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.diff_courses_in_database(df)
+        ... # Invalid rows returned
+        ... # Changed courses applied to the database
+        """
+        courses, invalid_rows = self.normalize_course_data(df)
+        if progress:
+            progress(invalid_rows=len(invalid_rows))
+        columns = [column.name for column in Course.__table__.columns if column.name != "id"]
+        existing = pd.DataFrame(
+            self.db.session.query(Course.id, *[getattr(Course, column) for column in columns]).order_by(Course.id).all(),
+            columns=["id"] + columns,
+        )
+        enrollment_counts = dict(
+            self.db.session.query(enrollments.c.course_id, func.count())
+            .group_by(enrollments.c.course_id)
+            .all()
+        )
+        student_enrollments = self.get_enrollments_by_student()
+        max_course_id = int(existing["id"].max()) if not existing.empty else 0
+
+        keys = COURSE_DIFF_KEY_COLUMNS + ["occurrence"]
+        courses["occurrence"] = courses.groupby(COURSE_DIFF_KEY_COLUMNS).cumcount()
+        existing["occurrence"] = existing.groupby(COURSE_DIFF_KEY_COLUMNS).cumcount()
+
+        matched = courses.merge(existing, on=keys, suffixes=("", "_existing"))
+        matched["num_enrolled"] += matched["id"].map(enrollment_counts).fillna(0).astype(int)
+        value_columns = [column for column in columns if column not in COURSE_DIFF_KEY_COLUMNS]
+        changed = pd.concat(
+            [matched[column].astype(str).ne(matched[f"{column}_existing"].astype(str)) for column in value_columns], axis=1
+        ).any(axis=1)
+        updated = matched.loc[changed, value_columns].assign(course_id=matched.loc[changed, "id"])
+
+        inserted = courses.merge(existing[keys], on=keys, how="left", indicator=True)
+        inserted = inserted.loc[inserted["_merge"] == "left_only", columns]
+        deleted = [int(course_id) for course_id in existing.loc[~existing["id"].isin(matched["id"]), "id"]]
+
+        try:
+            for start in range(0, len(deleted), INSERT_CHUNK_SIZE):
+                chunk = deleted[start:start + INSERT_CHUNK_SIZE]
+                self.db.session.execute(delete(enrollments).where(enrollments.c.course_id.in_(chunk)))
+                self.db.session.execute(delete(Course.__table__).where(Course.__table__.c.id.in_(chunk)))
+            if not updated.empty:
+                self.db.session.execute(
+                    update(Course.__table__).where(Course.__table__.c.id == bindparam("course_id")),
+                    updated.to_dict("records"),
+                )
+            self.bulk_insert_courses(inserted, progress=progress)
+        except Exception as e:
+            self.db.session.rollback()
+            raise DatabaseError(f"Error applying course changes: {str(e)}")
+        self.update_student_enrollments(student_enrollments, min_course_id=max_course_id)
+        return invalid_rows
+
+    def update_student_enrollments(self, student_enrollments: dict, min_course_id: int = 0) -> None:
         """
-        for student_id, groupings in student_enrollments.items():
-            groupings = list(groupings)
-            self.add_courses_by_groupings(student_id, groupings)
+        Re-enroll students in their preserved course groupings after a timetable update.
+
+        Args:
+        -----
+        student_enrollments (dict): A mapping of student ID to the set of course groupings to restore.
+        min_course_id (int): Only courses with a greater ID are enrolled into and recounted.
+
+        Returns:
+        --------
+        None
+
+        Notes:
+        ------
+        1. A course grouping to course ID map is built once from the new timetable.
+        2. All enrollments are bulk inserted; groupings missing from the new timetable are skipped.
+        3. num_enrolled is incremented by each course's enrollment count in a single UPDATE.
+        4. The dashboard statistics are recounted and all changes are committed in one transaction.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.update_student_enrollments({"A01234567": {"1ACOMP 1510"}})
+        ... # Student re-enrolled in every course of grouping 1ACOMP 1510
+        """
+        grouping_courses = {}
+        new_courses = self.db.session.query(Course.id, Course.course_grouping).filter(Course.id > min_course_id)
+        for course_id, course_grouping in new_courses.all():
+            grouping_courses.setdefault(course_grouping, []).append(course_id)
+        new_enrollments = [
+            {"student_id": student_id, "course_id": course_id}
+            for student_id, groupings in student_enrollments.items()
+            for grouping in groupings
+            for course_id in grouping_courses.get(grouping, [])
+        ]
+        try:
+            if not new_enrollments:
+                self.refresh_dashboard_stats()
+                self.db.session.commit()
+                return
+            self.bulk_insert_rows(enrollments, new_enrollments)
+            enrollment_count = (
+                select(func.count())
+                .where(enrollments.c.course_id == Course.id)
+                .scalar_subquery()
+            )
+            self.db.session.execute(
+                update(Course)
+                .where(Course.id > min_course_id, Course.id.in_(select(enrollments.c.course_id)))
+                .values(num_enrolled=Course.num_enrolled + enrollment_count)
+                .execution_options(synchronize_session=False)
+            )
+            self.refresh_dashboard_stats()
+            self.db.session.commit()
+        except Exception as e:
+            self.db.session.rollback()
+            raise DatabaseError(f"Error updating student enrollments: {str(e)}")
 
     def get_enrollments_by_student(self) -> dict:
         """
-        """
-        all_enrollments = self.db.session.query(enrollments).all()
+        Get the course groupings each student is enrolled in.
+
+        Returns:
+        --------
+        dict: A mapping of student ID to the set of course groupings the student is enrolled in.
+
+        Notes:
+        ------
+        1. Enrollments are joined to courses and deduplicated in a single query.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_enrollments_by_student()
+        ... {"A01234567": {"1ACOMP 1510", "1ACOMP 1537"}}
+        """
+        rows = (
+            self.db.session.query(enrollments.c.student_id, Course.course_grouping)
+            .join(Course, Course.id == enrollments.c.course_id)
+            .distinct()
+            .all()
+        )
         student_enrollments = {}
-        for enrollment in all_enrollments:
-            course_grouping = self.db.session.query(Course).filter(Course.id == enrollment.course_id).first().course_grouping
-            if enrollment.student_id in student_enrollments:
-                student_enrollments[enrollment.student_id].add(course_grouping)
-            else:
-                student_enrollments[enrollment.student_id] = {course_grouping}
+        for student_id, course_grouping in rows:
+            student_enrollments.setdefault(student_id, set()).add(course_grouping)
         return student_enrollments
 
-    def bulk_course_replace(self, file) -> list:
+    def bulk_course_replace(self, file, progress: callable = None) -> list:
         """
         Save the bulk course upload file to the database.
 
         Args:
         -----
         file (FileStorage): The file to save.
+        progress (callable): Called with keyword counts (rows_parsed, invalid_rows, rows_inserted) as the import advances.
 
         Returns:
         --------
@@ -107,10 +282,14 @@ class Database:
             raise InvalidFileType("Invalid file format. Please upload an XLSX file.")
         try:
             df = self.parse_bulk_course_upload_file(file)
+            if progress:
+                progress(rows_parsed=len(df))
             self.set_all_student_is_completed_and_is_approved_by_program_heads_to_false()
-            return self.upload_courses_to_database(df)
+            return self.upload_courses_to_database(df, progress=progress)
         except:
             raise InvalidUploadFile("Invalid file format. Error processing the file.")
+        finally:
+            self.invalidate_course_offerings()
 
     def set_all_student_is_completed_and_is_approved_by_program_heads_to_false(self):
         """
@@ -118,6 +297,7 @@ class Database:
         try:
             self.db.session.query(Student).update({Student.is_completed: False, Student.is_approved_by_program_heads: False})
             self.db.session.query(ScheduleProgression).filter(ScheduleProgression.date == datetime.now().date()).update({ScheduleProgression.num_schedules_completed: 0, ScheduleProgression.num_approvals_from_program_heads: 0})
+            self.refresh_dashboard_stats()
             self.db.session.commit()
         except Exception as e:
             raise DatabaseError(f"Error updating student: {str(e)}")
@@ -136,9 +316,9 @@ class Database:
 
         Notes:
         ------
-        1. The file is read as a DataFrame.
-        2. The columns are cleaned by removing special characters.
-        3. The unnecessary columns are removed.
+        1. The file is streamed in chunks, with unnecessary columns removed at read time.
+        2. The column names and string values are cleaned by removing special characters.
+        3. The chunks are combined into a single DataFrame.
         4. The instructor names are cleaned.
         5. The data is grouped by the columns and the instructors are aggregated.
         6. The DataFrame is returned.
@@ -151,79 +331,290 @@ class Database:
 
         Author: ``@ChinaiArman``
         """
-        df = pd.read_excel(file)
-        df = df.map(
-            lambda x: (
-                x.replace("*", "").replace("\n", "").strip()
-                if isinstance(x, str)
-                else x
-            )
-        )
-        df.columns = df.columns.map(
-            lambda x: x.replace("*", "").replace("\n", "").strip()
-        )
-        df.drop(columns=DROP_COURSE_COLUMNS, inplace=True)
-        df["Instructor"] = df["Instructor"].map(lambda x: " ".join(x.split(", ")[::-1]))
-        df = (
-            df.groupby([column for column in df.columns if column != "Instructor"])
-            .agg({"Instructor": lambda x: ",".join(set(x))})
-            .reset_index()
+        df = pd.concat(self.read_bulk_course_upload_file(file), ignore_index=True)
+        df["Instructor"] = self.normalize_string_column(df["Instructor"]).str.split(", ").str[::-1].str.join(" ")
+        return self.aggregate_course_instructors(df)
+
+    def aggregate_course_instructors(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Collapse rows that only differ by instructor into a single row.
+
+        Args:
+        -----
+        df (pd.DataFrame): The DataFrame with one row per meeting and instructor.
+
+        Returns:
+        --------
+        pd.DataFrame: The DataFrame with one row per meeting, instructors joined by ",".
+
+        Notes:
+        ------
+        1. Every non-instructor column is hashed into one integer group key.
+        2. Rows with a missing value in any non-instructor column are dropped.
+        3. Duplicate instructors are removed and the rest are concatenated per group with a string sum, in order of appearance.
+        4. Rows are returned sorted by the non-instructor columns.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.aggregate_course_instructors(df)
+        ... # DataFrame returned
+        """
+        columns = [column for column in df.columns if column != "Instructor"]
+        group_keys = df.groupby(columns, sort=True, dropna=True).ngroup()
+        df = df[group_keys >= 0]
+        group_keys = group_keys[group_keys >= 0]
+        instructors = (
+            pd.DataFrame({"group": group_keys, "Instructor": df["Instructor"]})
+            .dropna()
+            .drop_duplicates()
         )
+        instructors = ("," + instructors["Instructor"]).groupby(instructors["group"]).sum().str[1:]
+        first_rows = ~group_keys.duplicated()
+        courses = df.loc[first_rows, columns]
+        courses["Instructor"] = group_keys[first_rows].map(instructors)
+        courses.index = group_keys[first_rows].values
+        return courses.sort_index().reset_index(drop=True)
+
+    def read_bulk_course_upload_file(self, file, chunk_size: int = COURSE_READ_CHUNK_SIZE):
+        """
+        Stream the first sheet of the bulk course upload file as cleaned DataFrame chunks.
+
+        Args:
+        -----
+        file (FileStorage): The file to read.
+        chunk_size (int): The number of rows per chunk.
+
+        Yields:
+        -------
+        pd.DataFrame: The next chunk of rows, without the columns in DROP_COURSE_COLUMNS.
+
+        Raises:
+        -------
+        InvalidUploadFile: If the sheet is empty or is missing expected columns.
+
+        Notes:
+        ------
+        1. The workbook is opened in read-only mode, so rows are parsed lazily instead of loading every sheet.
+        2. Duplicate headers are suffixed (".1", ".2", ...) as pd.read_excel does.
+        3. Only string columns are cleaned.
+        4. At least one (possibly empty) chunk is always yielded.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> df = pd.concat(db.read_bulk_course_upload_file(file), ignore_index=True)
+        ... # DataFrame returned
+        """
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                raise InvalidUploadFile("Invalid file format. The file is empty.")
+            columns = []
+            seen = {}
+            for index, name in enumerate(header):
+                name = str(name) if name is not None else f"Unnamed: {index}"
+                if name in seen:
+                    seen[name] += 1
+                    name = f"{name}.{seen[name]}"
+                else:
+                    seen[name] = 0
+                columns.append(name.replace("*", "").replace("\n", "").strip())
+            missing_columns = [column for column in DROP_COURSE_COLUMNS if column not in columns]
+            if missing_columns:
+                raise InvalidUploadFile(f"Invalid file format. Missing columns: {missing_columns}")
+            keep = [index for index, column in enumerate(columns) if column not in DROP_COURSE_COLUMNS]
+            keep_columns = [columns[index] for index in keep]
+
+            chunk = []
+            yielded = False
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                chunk.append([row[index] if index < len(row) else None for index in keep])
+                if len(chunk) == chunk_size:
+                    yield self.clean_course_upload_chunk(pd.DataFrame(chunk, columns=keep_columns))
+                    yielded = True
+                    chunk = []
+            if chunk or not yielded:
+                yield self.clean_course_upload_chunk(pd.DataFrame(chunk, columns=keep_columns))
+        finally:
+            workbook.close()
+
+    def clean_course_upload_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remove "*" and newlines from, and strip, the string values of a course upload chunk.
+
+        Args:
+        -----
+        df (pd.DataFrame): The chunk to clean.
+
+        Returns:
+        --------
+        pd.DataFrame: The cleaned chunk.
+
+        Notes:
+        ------
+        1. Numeric and date columns are left untouched.
+        2. Columns holding only strings are cleaned with vectorized string methods.
+        3. Columns mixing strings and other values are cleaned value by value.
+        """
+        for column in df.columns:
+            if df[column].dtype != object:
+                continue
+            if pd.api.types.infer_dtype(df[column], skipna=True) == "string":
+                df[column] = (
+                    df[column]
+                    .str.replace("*", "", regex=False)
+                    .str.replace("\n", "", regex=False)
+                    .str.strip()
+                )
+            else:
+                df[column] = df[column].map(
+                    lambda x: (
+                        x.replace("*", "").replace("\n", "").strip()
+                        if isinstance(x, str)
+                        else x
+                    )
+                )
         return df
 
-    def normalize_course_data(self, row: pd.Series) -> pd.Series:
+    def normalize_course_data(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list]:
         """
-        Normalize the course data.
+        Normalize the course data column by column.
 
         Args:
         -----
-        row (pd.Series): The row to normalize.
+        df (pd.DataFrame): The parsed DataFrame to normalize.
 
         Returns:
         --------
-        pd.Series: The normalized row.
+        tuple[pd.DataFrame, list]: The normalized DataFrame (one column per Course attribute) and a list of invalid rows.
 
         Notes:
         ------
         1. Matches the column requirements for the Course model.
+        2. Every column is converted in bulk; values that cannot be converted (e.g. blanks or numbers in a text column) become null.
+        3. Any row with a null in a required column is reported as invalid and dropped.
 
         Example:
         --------
         >>> db = Database()
-        >>> db.normalize_course_data(row)
-        ... # Normalized row returned
+        >>> courses, invalid_rows = db.normalize_course_data(df)
+        ... # Normalized DataFrame and invalid rows returned
+        """
+        courses = pd.DataFrame(index=df.index)
+        courses["status"] = df["Status"].eq("Active").map({True: "Active", False: "Inactive"})
+        courses["block"] = self.normalize_string_column(df["Block"], 8)
+        courses["crn"] = self.normalize_integer_column(df["CRN"])
+        courses["course_code"] = self.normalize_string_column(df["Course"], 8)
+        courses["course_type"] = self.normalize_string_column(df["Type"], 3)
+        courses["day"] = self.normalize_string_column(df["Day"], 3)
+        courses["begin_time"] = self.normalize_course_time_column(df["Begin Time"])
+        courses["end_time"] = self.normalize_course_time_column(df["End Time"])
+        courses["building_room"] = self.normalize_string_column(df["Bldg/Room"], 10)
+        courses["start_date"] = self.normalize_course_date_column(df["Start Date"])
+        courses["end_date"] = self.normalize_course_date_column(df["End Date"])
+        courses["max_capacity"] = self.normalize_integer_column(df["Max."])
+        courses["num_enrolled"] = self.normalize_integer_column(df["Act."])
+        courses["is_full_time"] = df["FT/PT"].eq("FT")
+        courses["term_code"] = self.normalize_integer_column(df["Term Code (swvmday)"])
+        courses["instructor"] = self.normalize_string_column(df["Instructor"], 512)
+
+        invalid = courses.isna().any(axis=1)
+        invalid_rows = (
+            pd.DataFrame({
+                "crn": courses["crn"].where(courses["crn"].notna(), df["CRN"]),
+                "course": courses["course_code"].where(courses["course_code"].notna(), df["Course"]),
+                "block": courses["block"].where(courses["block"].notna(), df["Block"]),
+                "instructor": df["Instructor"],
+            })[invalid]
+            .astype(object)
+            .to_dict("records")
+        )
+
+        courses = courses[~invalid].copy()
+        for column in ["crn", "max_capacity", "num_enrolled", "term_code"]:
+            courses[column] = courses[column].astype(int)
+        courses["course_grouping"] = courses["block"] + courses["course_code"]
+        return courses, invalid_rows
+
+    def normalize_integer_column(self, column: pd.Series) -> pd.Series:
         """
-        row["Status"] = "Active" if row["Status"] == "Active" else "Inactive"
-        row["Block"] = row["Block"][:8]
-        row["CRN"] = int(row["CRN"])
-        row["Course"] = row["Course"][:8]
-        row["Type"] = row["Type"][:3]
-        row["Day"] = row["Day"][:3]
-        row["Begin Time"] = datetime.strptime(
-            str(int(row["Begin Time"])), "%H%M"
-        ).time()
-        row["End Time"] = datetime.strptime(str(int(row["End Time"])), "%H%M").time()
-        row["Bldg/Room"] = row["Bldg/Room"][:10]
-        row["Start Date"] = datetime.strptime(
-            str(row["Start Date"]), "%Y-%m-%d %H:%M:%S"
-        ).date()
-        row["End Date"] = datetime.strptime(
-            str(row["End Date"]), "%Y-%m-%d %H:%M:%S"
-        ).date()
-        row["Max."] = int(row["Max."])
-        row["Act."] = int(row["Act."])
-        row["FT/PT"] = True if row["FT/PT"] == "FT" else False
-        row["Term Code (swvmday)"] = int(row["Term Code (swvmday)"])
-        row["Instructor"] = row["Instructor"][:512]
-        return row
+        Convert a column to integers, truncating decimals.
+
+        Args:
+        -----
+        column (pd.Series): The column to convert.
+
+        Returns:
+        --------
+        pd.Series: The converted column, with null for values that are not numeric.
+        """
+        return np.trunc(pd.to_numeric(column, errors="coerce")).astype("Int64")
+
+    def normalize_string_column(self, column: pd.Series, length: int = None) -> pd.Series:
+        """
+        Truncate the strings of a column.
+
+        Args:
+        -----
+        column (pd.Series): The column to truncate.
+        length (int): The maximum length of each string, or None to keep whole strings.
+
+        Returns:
+        --------
+        pd.Series: The truncated column, with null for values that are not strings (blanks, numbers).
+
+        Notes:
+        ------
+        1. Works whatever dtype pandas read the column as, e.g. float64 for a column that is entirely blank.
+        """
+        is_string = column.map(lambda value: isinstance(value, str)).astype(bool)
+        return column.astype(object).where(is_string).astype("string").str.slice(0, length).astype(object)
+
+    def normalize_course_time_column(self, column: pd.Series) -> pd.Series:
+        """
+        Convert a column of HHMM integers (e.g. 830, 1430) into time objects.
+
+        Args:
+        -----
+        column (pd.Series): The column to convert.
+
+        Returns:
+        --------
+        pd.Series: The converted column, with null for values that are not valid times.
+        """
+        hhmm = self.normalize_integer_column(column).astype("string").str.zfill(4)
+        return pd.to_datetime(hhmm, format="%H%M", errors="coerce").dt.time
+
+    def normalize_course_date_column(self, column: pd.Series) -> pd.Series:
+        """
+        Convert a column of timestamps (or "%Y-%m-%d %H:%M:%S" strings) into date objects.
+
+        Args:
+        -----
+        column (pd.Series): The column to convert.
+
+        Returns:
+        --------
+        pd.Series: The converted column, with null for values that are not valid dates.
+        """
+        if not pd.api.types.is_datetime64_any_dtype(column):
+            column = pd.to_datetime(column.astype(str), format="%Y-%m-%d %H:%M:%S", errors="coerce")
+        return column.dt.date
 
-    def upload_courses_to_database(self, df: pd.DataFrame) -> list:
+    def upload_courses_to_database(self, df: pd.DataFrame, chunk_size: int = INSERT_CHUNK_SIZE, progress: callable = None) -> list:
         """
         Upload the courses to the database.
 
         Args:
         -----
         df (pd.DataFrame): The DataFrame to upload.
+        chunk_size (int): The number of rows sent per INSERT statement.
+        progress (callable): Called with keyword counts (invalid_rows, rows_inserted) as the upload advances.
 
         Returns:
         --------
@@ -231,7 +622,7 @@ class Database:
 
         Notes:
         ------
-        1. The courses are uploaded to the database.
+        1. The courses are uploaded to the database in batches.
         2. Invalid rows are returned.
 
         Example:
@@ -243,51 +634,78 @@ class Database:
         """
         self.db.session.query(enrollments).delete()
         self.db.session.query(Course).delete()
+        self.refresh_dashboard_stats()
         self.db.session.commit()
         self.db.session.execute(text("ALTER TABLE courses AUTO_INCREMENT = 1"))
-        invalid_rows = []
-        for _, row in df.iterrows():
-            try:
-                row = self.normalize_course_data(row)
-                course = Course(
-                    status=row["Status"],
-                    block=row["Block"],
-                    crn=row["CRN"],
-                    course_grouping=row["Block"] + row["Course"],
-                    course_code=row["Course"],
-                    course_type=row["Type"],
-                    day=row["Day"],
-                    begin_time=row["Begin Time"],
-                    end_time=row["End Time"],
-                    building_room=row["Bldg/Room"],
-                    start_date=row["Start Date"],
-                    end_date=row["End Date"],
-                    max_capacity=row["Max."],
-                    num_enrolled=row["Act."],
-                    is_full_time=row["FT/PT"],
-                    term_code=row["Term Code (swvmday)"],
-                    instructor=row["Instructor"],
-                )
-                self.db.session.add(course)
-            except:
-                invalid_rows.append(
-                    {
-                        "crn": row["CRN"],
-                        "course": row["Course"],
-                        "block": row["Block"],
-                        "instructor": row["Instructor"],
-                    }
-                )
+        courses, invalid_rows = self.normalize_course_data(df)
+        if progress:
+            progress(invalid_rows=len(invalid_rows))
+        self.bulk_insert_courses(courses, chunk_size, progress)
         self.db.session.commit()
         return invalid_rows
 
-    def bulk_student_replace(self, file) -> list:
+    def bulk_insert_courses(self, courses: pd.DataFrame, chunk_size: int = INSERT_CHUNK_SIZE, progress: callable = None) -> None:
+        """
+        Insert normalized courses with batched multi-row INSERT statements.
+
+        Args:
+        -----
+        courses (pd.DataFrame): The normalized courses, one column per Course attribute.
+        chunk_size (int): The number of rows sent per INSERT statement.
+        progress (callable): Called with rows_inserted after each batch.
+
+        Returns:
+        --------
+        None
+
+        Notes:
+        ------
+        1. Rows are inserted through the Core table, skipping ORM object creation and the identity map.
+        2. The caller is responsible for committing the session.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.bulk_insert_courses(courses, chunk_size=500)
+        ... # Courses inserted in batches of 500
+        """
+        self.bulk_insert_rows(Course.__table__, courses.to_dict("records"), chunk_size, progress)
+
+    def bulk_insert_rows(self, table, records: list, chunk_size: int = INSERT_CHUNK_SIZE, progress: callable = None) -> None:
+        """
+        Insert rows into a table with batched multi-row INSERT statements.
+
+        Args:
+        -----
+        table (Table): The table to insert into.
+        records (list): The rows to insert, as dicts keyed by column name.
+        chunk_size (int): The number of rows sent per INSERT statement.
+        progress (callable): Called with rows_inserted after each batch.
+
+        Returns:
+        --------
+        None
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.bulk_insert_rows(enrollments, [{"student_id": "A01234567", "course_id": 1}])
+        ... # Rows inserted
+        """
+        for start in range(0, len(records), chunk_size):
+            chunk = records[start:start + chunk_size]
+            self.db.session.execute(insert(table), chunk)
+            if progress:
+                progress(rows_inserted=start + len(chunk))
+
+    def bulk_student_replace(self, file, progress: callable = None) -> list:
         """ 
         Save the bulk student upload file to the database.
 
         Args:
         -----
         file (FileStorage): The file to save.
+        progress (callable): Called with keyword counts (rows_parsed, invalid_rows, rows_inserted) as the import advances.
 
         Returns:
         --------
@@ -311,8 +729,13 @@ class Database:
             raise InvalidFileType("Invalid file format. Please upload an CSV file.")
         try:
             df = pd.read_csv(file)
+            if progress:
+                progress(rows_parsed=len(df))
             self.db.session.query(ScheduleProgression).filter(ScheduleProgression.date == datetime.now().date()).update({ScheduleProgression.num_schedules_completed: 0, ScheduleProgression.num_approvals_from_program_heads: 0})
-            return self.upload_students_to_database(df)
+            invalid_rows = self.upload_students_to_database(df)
+            if progress:
+                progress(invalid_rows=len(invalid_rows), rows_inserted=len(df) - len(invalid_rows))
+            return invalid_rows
         except:
             raise InvalidUploadFile("Invalid file format. Error processing the file.")
 
@@ -368,36 +791,91 @@ class Database:
             self.db.session.query(enrollments).delete()
             self.db.session.query(Preferences).delete()
             self.db.session.query(Student).delete()
-            invalid_rows = []
-            for _, row in df.iterrows():
-                try:
-                    row = self.normalize_student_data(row)
-                    student = Student(
-                        id=row["BCIT Student Number"],
-                        first_name=row["Legal First Name"],
-                        last_name=row["Legal Last Name"],
-                        email=row["BCIT Email"],
-                        term_code=row["Term Code"],
-                    )
-                    self.db.session.add(student)
-
-                    preferences = [row[f"Course Code Preference #{i + 1}"] for i in range(0, 8) if row[f"Course Code Preference #{i + 1}"] and row[f"Course Code Preference #{i + 1}"] != ""] 
-                    self.add_student_preferences(student.id, preferences)
-
-                except Exception as e:
-                    invalid_rows.append({"id": row["BCIT Student Number"]})
+            students, preferences, invalid_rows = self.normalize_student_upload_data(df)
+            self.bulk_insert_rows(Student.__table__, students.to_dict("records"))
+            self.bulk_insert_rows(Preferences.__table__, preferences.to_dict("records"))
+            self.refresh_dashboard_stats()
             self.db.session.commit()
             return invalid_rows
         except Exception as e:
+            self.db.session.rollback()
             raise DatabaseError(f"Error uploading students to the database: {str(e)}")
 
-    def bulk_student_update(self, file) -> list:
+    def normalize_student_upload_data(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, list]:
+        """
+        Normalize the student upload data column by column.
+
+        Args:
+        -----
+        df (pd.DataFrame): The student upload DataFrame.
+
+        Returns:
+        --------
+        tuple[pd.DataFrame, pd.DataFrame, list]: The students and preferences (one column per table column) and a list of invalid rows.
+
+        Notes:
+        ------
+        1. Matches the column requirements for the Student and Preferences models.
+        2. A row is invalid if a student field is missing or cannot be converted, if a preference is not text, or if its ID
+           or email repeats an earlier row.
+        3. The "Course Code Preference #N" columns are melted into one row per preference; blank preferences are skipped.
+        4. Priorities are numbered from 1 in column order, ignoring the skipped preferences.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> students, preferences, invalid_rows = db.normalize_student_upload_data(df)
+        ... # Normalized DataFrames and invalid rows returned
+        """
+        students = pd.DataFrame(index=df.index)
+        students["id"] = self.normalize_string_column(df["BCIT Student Number"], 9)
+        students["first_name"] = self.normalize_string_column(df["Legal First Name"], 50)
+        students["last_name"] = self.normalize_string_column(df["Legal Last Name"], 50)
+        students["email"] = self.normalize_string_column(df["BCIT Email"], 100)
+        students["term_code"] = self.normalize_integer_column(df["Term Code"])
+
+        preference_columns = [column for column in df.columns if column.startswith("Course Code Preference")]
+        preference_values = df[preference_columns].astype(object)
+        invalid_preferences = (
+            preference_values.notna() & ~preference_values.map(lambda value: isinstance(value, str))
+        ).any(axis=1)
+
+        invalid = (
+            students.isna().any(axis=1)
+            | students["id"].duplicated()
+            | students["email"].duplicated()
+            | invalid_preferences
+        )
+        invalid_rows = (
+            pd.DataFrame({"id": df["BCIT Student Number"]})[invalid]
+            .astype(object)
+            .to_dict("records")
+        )
+        students = students[~invalid].copy()
+        students["term_code"] = students["term_code"].astype(int)
+        students["is_completed"] = False
+        students["is_approved_by_program_heads"] = False
+
+        preferences = (
+            preference_values[~invalid]
+            .assign(student_id=students["id"])
+            .melt(id_vars="student_id", value_vars=preference_columns, var_name="column", value_name="preference")
+        )
+        preferences["preference"] = self.normalize_string_column(preferences["preference"], 8)
+        preferences = preferences[preferences["preference"].notna() & preferences["preference"].ne("")]
+        preferences["column"] = preferences["column"].map(preference_columns.index)
+        preferences = preferences.sort_values(["student_id", "column"], kind="stable")
+        preferences["priority"] = preferences.groupby("student_id").cumcount() + 1
+        return students, preferences[["student_id", "priority", "preference"]], invalid_rows
+
+    def bulk_student_update(self, file, progress: callable = None) -> list:
         """ 
         Save the bulk student upload file to the database.
 
         Args:
         -----
         file (FileStorage): The file to save.
+        progress (callable): Called with keyword counts (rows_parsed, invalid_rows, rows_inserted) as the import advances.
 
         Returns:
         --------
@@ -420,7 +898,12 @@ class Database:
             raise InvalidFileType("Invalid file format. Please upload an CSV file.")
         try:
             df = pd.read_csv(file)
-            return self.update_students_in_database(df)
+            if progress:
+                progress(rows_parsed=len(df))
+            results = self.update_students_in_database(df)
+            if progress:
+                progress(invalid_rows=len(results['invalid_rows']), rows_inserted=len(results['added_students']))
+            return results
         except:
             raise InvalidUploadFile("Invalid file format. Error processing the file.")
         
@@ -434,14 +917,15 @@ class Database:
 
         Returns:
         --------
-        list: A list of invalid rows.
+        dict: The invalid rows, updated students (with the changed fields) and added students.
 
         Notes:
         ------
-        1. Students are matched using BCIT Student Number
-        2. Only modified fields are updated
-        3. Invalid rows are tracked and returned
-        4. No data is deleted from the enrollments table
+        1. Students are matched using BCIT Student Number, prefetched with chunked IN queries
+        2. Only students with modified fields are updated, in a single executemany UPDATE
+        3. New students and their preferences are bulk inserted, and counted in the dashboard statistics
+        4. Invalid rows are tracked and returned
+        5. No data is deleted from the enrollments table
 
         Example:
         --------
@@ -449,78 +933,57 @@ class Database:
         >>> result = db.update_students_in_database(df)
         >>> print(f"Updated {len(result['updated_students'])} students")
         """
+        students, preferences, invalid_rows = self.normalize_student_upload_data(df)
         results = {
-            'invalid_rows': [],
+            'invalid_rows': [{"id": row["id"], "error": "Missing or invalid student data"} for row in invalid_rows],
             'updated_students': [],
             'added_students': []
         }
 
-        for _, row in df.iterrows():
-            try:
-                # Normalize the incoming data
-                row = self.normalize_student_data(row)
-                
-                # Find existing student by BCIT Student Number
-                existing_student = self.db.session.query(Student).filter(
-                    Student.id == row["BCIT Student Number"]
-                ).first()
-
-                if not existing_student:
-                    results['added_students'].append({
-                        "id": row["BCIT Student Number"]
-                    })
-                    student = Student(
-                        id=row["BCIT Student Number"],
-                        first_name=row["Legal First Name"],
-                        last_name=row["Legal Last Name"],
-                        term_code=row["Term Code"],
-                        email=row["BCIT Email"],
-                        is_completed=False,
-                        is_approved_by_program_heads=False
-                    )
-                    self.db.session.add(student)
-                    preferences = [row[f"Course Code Preference #{i + 1}"] for i in range(0, 8) if row[f"Course Code Preference #{i + 1}"] and row[f"Course Code Preference #{i + 1}"] != ""]
-                    self.add_student_preferences(student.id, preferences)
-                    continue
+        # Prefetch the existing students for the incoming IDs in chunks
+        fields = ["first_name", "last_name", "email", "term_code"]
+        incoming_ids = students["id"].tolist()
+        existing = []
+        for start in range(0, len(incoming_ids), INSERT_CHUNK_SIZE):
+            existing.extend(
+                self.db.session.query(Student.id, *[getattr(Student, field) for field in fields])
+                .filter(Student.id.in_(incoming_ids[start:start + INSERT_CHUNK_SIZE]))
+                .all()
+            )
+        existing = pd.DataFrame(existing, columns=["id"] + fields)
 
-                # Create dictionary of new values
-                new_values = {
-                    "first_name": row["Legal First Name"],
-                    "last_name": row["Legal Last Name"],
-                    "email": row["BCIT Email"],
-                    "term_code": row["Term Code"]
-                }
+        # Compare every field at once and keep the students with at least one change
+        matched = students.merge(existing, on="id", suffixes=("", "_existing"))
+        changed = pd.DataFrame(
+            {field: matched[field].astype(str).ne(matched[f"{field}_existing"].astype(str)) for field in fields}
+        )
+        changed_students = matched[changed.any(axis=1)]
+        for student_id, row in zip(changed_students["id"], changed[changed.any(axis=1)].itertuples(index=False)):
+            results['updated_students'].append({
+                "id": student_id,
+                "fields": [field for field, is_changed in zip(fields, row) if is_changed]
+            })
+
+        added = students[~students["id"].isin(existing["id"])]
+        results['added_students'] = [{"id": student_id} for student_id in added["id"]]
 
-                # Track if any changes were made
-                changes_made = False
-                fields = []
-
-                # Compare and update only changed fields
-                for field, new_value in new_values.items():
-                    current_value = getattr(existing_student, field)
-                    if current_value != new_value:
-                        setattr(existing_student, field, new_value)
-                        fields.append(field)
-                        changes_made = True
-
-                if changes_made:
-                    results['updated_students'].append({
-                        "id": row["BCIT Student Number"],
-                        "fields": fields
-                    })
-
-            except Exception as e:
-                results['invalid_rows'].append({
-                    "id": row.get("BCIT Student Number", "Unknown"),
-                    "error": str(e)
-                })
-
-        # Commit all changes at once
         try:
+            if not changed_students.empty:
+                self.db.session.execute(
+                    update(Student.__table__).where(Student.__table__.c.id == bindparam("student_id")),
+                    changed_students[fields].assign(student_id=changed_students["id"]).to_dict("records"),
+                )
+            self.bulk_insert_rows(Student.__table__, added.to_dict("records"))
+            self.bulk_insert_rows(
+                Preferences.__table__,
+                preferences[preferences["student_id"].isin(added["id"])].to_dict("records"),
+            )
+            self.add_to_dashboard_stats(total_students=len(added))
             self.db.session.commit()
         except Exception as e:
-            self.db.session
-
+            self.db.session.rollback()
+            raise DatabaseError(f"Error updating students in the database: {str(e)}")
+        return results
 
     def get_student_by_id(self, id: int) -> dict:
         """
@@ -541,12 +1004,12 @@ class Database:
         ... {"id": 1, "firstName": "John", "lastName": "Doe", "selection": [], "courses": []}
         """
         try:
-            student = self.db.session.query(Student).filter(Student.id == id).first()
+            students = serialize_students(self.db.session, (Student.id == id,))
         except Exception as e:
             raise DatabaseError(f"Error querying into database: {str(e)}")
-        if not student:
+        if not students:
             raise DataNotFound(f"Unable to find student by ID: {id}")
-        return student.to_dict()
+        return students[0]
 
     def create_student(self, data) -> dict:
         """
@@ -596,6 +1059,7 @@ class Database:
             preferences = [row[f"Course Code Preference #{i+1}"] for i in range(0, len(data.get("preferences"))) if row[f"Course Code Preference #{i+1}"]]
 
             self.change_student_preferences(student.id, preferences) 
+            self.add_to_dashboard_stats(total_students=1)
             self.db.session.commit()
             return
         except Exception as e:
@@ -625,6 +1089,7 @@ class Database:
             student = self.db.session.query(Student).filter(Student.id == id).first()
             if not student:
                 raise DataNotFound(f"Student with ID not found: {id}")
+            before = self.get_dashboard_state(id)
             
             updatable_columns = ['first_name', 'last_name', 'term_code', 'email', 'is_completed']
             for key, value in data.items():
@@ -637,6 +1102,7 @@ class Database:
             if data.get("courses"):
                 self.replace_courses_for_student(id, data.get("courses"))
 
+            self.update_dashboard_stats(before, self.get_dashboard_state(id))
             self.db.session.commit()
             return
         except Exception as e:
@@ -667,22 +1133,32 @@ class Database:
             
             # if student marked as completed or approved by program heads, reduce the count
             self.db.session.query(ScheduleProgression).filter(ScheduleProgression.date == datetime.now().date()).update({ScheduleProgression.num_schedules_completed: ScheduleProgression.num_schedules_completed - (1 if student.is_completed else 0), ScheduleProgression.num_approvals_from_program_heads: ScheduleProgression.num_approvals_from_program_heads - (1 if student.is_approved_by_program_heads else 0)})
+            before = self.get_dashboard_state(id)
             self.delete_student_preferences(id)
             self.db.session.query(enrollments).filter(enrollments.c.student_id == id).delete()
             self.db.session.delete(student)
+            self.update_dashboard_stats(before, (False, False, False))
             self.db.session.commit()
             return
         except Exception as e:
             raise DatabaseError(f"Error deleting student: {str(e)}")
 
-    def get_all_students(self) -> list:
+    def get_all_students(self, fields: tuple = None) -> list:
         """
         Get all students.
 
+        Args:
+        -----
+        fields (tuple): The student fields to include, or None for all fields.
+
         Returns:
         --------
         list: A list of all students.
 
+        Notes:
+        ------
+        1. Students are serialized from column queries, one per requested relationship, regardless of the number of students.
+
         Example:
         --------
         >>> db = Database()
@@ -690,37 +1166,140 @@ class Database:
         ... [{"id": 1, "firstName": "John", "lastName": "Doe", "selection": [], "courses": []}]
         """
         try:
-            students = self.db.session.query(Student).all()
+            return serialize_students(self.db.session, fields=fields)
+        except ValueError:
+            raise
         except Exception as e:
             raise DatabaseError(f"Error querying into database: {str(e)}")
-        return [student.to_dict() for student in students]
 
-    def export_students(self) -> pd.DataFrame:
+    def get_students_page(
+        self,
+        cursor: str = None,
+        limit: int = STUDENT_PAGE_DEFAULT_LIMIT,
+        term_code: int = None,
+        is_completed: bool = None,
+        is_approved_by_program_heads: bool = None,
+        has_courses: bool = None,
+        preference: str = None,
+    ) -> dict:
         """
-        Export all students.
+        Get one page of students, ordered by ID.
+
+        Args:
+        -----
+        cursor (str): Only students with an ID greater than this are returned (the previous page's next_cursor).
+        limit (int): The maximum number of students to return, capped at STUDENT_PAGE_MAX_LIMIT.
+        term_code (int): Only return students in this term.
+        is_completed (bool): Only return students with this completion status.
+        is_approved_by_program_heads (bool): Only return students with this approval status.
+        has_courses (bool): Only return students with (True) or without (False) any enrolled course.
+        preference (str): Only return students with this course code among their preferences.
 
         Returns:
         --------
-        pd.DataFrame: The DataFrame of all students.
+        dict: The students on the page and the cursor of the next page (None on the last page).
+
+        Notes:
+        ------
+        1. Keyset pagination on the primary key, so every page costs the same regardless of its position.
+        2. Students are returned without nested course payloads; preferences and enrolled course codes are
+           loaded for the whole page with one query each.
 
         Example:
         --------
         >>> db = Database()
-        >>> db.export_students()
-        ... # DataFrame returned
+        >>> db.get_students_page(limit=2, is_completed=False)
+        ... {"students": [{"id": "A00000001", ...}, {"id": "A00000002", ...}], "next_cursor": "A00000002"}
         """
+        limit = max(1, min(limit, STUDENT_PAGE_MAX_LIMIT))
         try:
-            students = self.db.session.query(Student).all()
+            query = self.db.session.query(
+                Student.id,
+                Student.first_name,
+                Student.last_name,
+                Student.email,
+                Student.term_code,
+                Student.is_completed,
+                Student.is_approved_by_program_heads,
+            )
+            if cursor is not None:
+                query = query.filter(Student.id > cursor)
+            if term_code is not None:
+                query = query.filter(Student.term_code == term_code)
+            if is_completed is not None:
+                query = query.filter(Student.is_completed == is_completed)
+            if is_approved_by_program_heads is not None:
+                query = query.filter(Student.is_approved_by_program_heads == is_approved_by_program_heads)
+            if has_courses is not None:
+                query = query.filter(Student.courses.any() if has_courses else ~Student.courses.any())
+            if preference is not None:
+                query = query.filter(Student.preferences.any(Preferences.preference == preference))
+            rows = query.order_by(Student.id).limit(limit + 1).all()
+
+            page = rows[:limit]
+            student_ids = [row.id for row in page]
+            preferences = {}
+            for student_id, course_code in (
+                self.db.session.query(Preferences.student_id, Preferences.preference)
+                .filter(Preferences.student_id.in_(student_ids))
+                .order_by(Preferences.student_id, Preferences.priority)
+            ):
+                preferences.setdefault(student_id, []).append(course_code)
+            course_codes = {}
+            for student_id, course_code in (
+                self.db.session.query(enrollments.c.student_id, Course.course_code)
+                .join(Course, Course.id == enrollments.c.course_id)
+                .filter(enrollments.c.student_id.in_(student_ids))
+                .distinct()
+                .order_by(enrollments.c.student_id, Course.course_code)
+            ):
+                course_codes.setdefault(student_id, []).append(course_code)
         except Exception as e:
             raise DatabaseError(f"Error querying into database: {str(e)}")
-        df = pd.DataFrame([student.to_dict() for student in students])
-        file_path = "exports/students.csv"
-        df.to_csv(file_path, index=False)
-        return file_path
+        return {
+            "students": [
+                {
+                    "id": row.id,
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                    "email": row.email,
+                    "term_code": row.term_code,
+                    "is_completed": row.is_completed,
+                    "is_approved_by_program_heads": row.is_approved_by_program_heads,
+                    "preferences": preferences.get(row.id, []),
+                    "course_codes": course_codes.get(row.id, []),
+                }
+                for row in page
+            ],
+            "next_cursor": page[-1].id if len(rows) > limit else None,
+        }
 
-    def add_student_preferences(self, student_id: int, courses: list) -> dict:
+    def export_students(self) -> pd.DataFrame:
         """
-        Add student preferences to the database.
+        Export all students.
+
+        Returns:
+        --------
+        pd.DataFrame: The DataFrame of all students.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.export_students()
+        ... # DataFrame returned
+        """
+        try:
+            students = serialize_students(self.db.session)
+        except Exception as e:
+            raise DatabaseError(f"Error querying into database: {str(e)}")
+        df = pd.DataFrame(students)
+        file_path = "exports/students.csv"
+        df.to_csv(file_path, index=False)
+        return file_path
+
+    def add_student_preferences(self, student_id: int, courses: list) -> dict:
+        """
+        Add student preferences to the database.
 
         Args:
         -----
@@ -831,7 +1410,9 @@ class Database:
             if enrollment:
                 raise DataAlreadyExists(f"Student is already enrolled in course: {course_id}")
             else :
+                before = self.get_dashboard_state(student_id)
                 self.db.session.execute(enrollments.insert().values(student_id=student_id, course_id=course_id))
+                self.update_dashboard_stats(before, self.get_dashboard_state(student_id))
 
             self.db.session.commit()
             return
@@ -870,7 +1451,9 @@ class Database:
             if not enrollment:
                 raise DataNotFound(f"Student is not enrolled in course: {course_id}")
             else:
+                before = self.get_dashboard_state(student_id)
                 self.db.session.execute(enrollments.delete().where(enrollments.c.student_id == student_id).where(enrollments.c.course_id == course_id))
+                self.update_dashboard_stats(before, self.get_dashboard_state(student_id))
 
             self.db.session.commit()
             return
@@ -911,12 +1494,16 @@ class Database:
             if invalid_courses:
                 raise DataNotFound(f"Invalid course ID(s) found: {invalid_courses}")
 
+            before = self.get_dashboard_state(student_id)
             self.db.session.execute(enrollments.delete().where(enrollments.c.student_id == student_id))
+            after = self.get_dashboard_state(student_id)
+            self.update_dashboard_stats(before, after)
             self.db.session.commit()
 
             new_enrollments = [{'student_id': student_id, 'course_id': course_id} for course_id in new_courses]
             
             self.db.session.execute(enrollments.insert(), new_enrollments)
+            self.update_dashboard_stats(after, self.get_dashboard_state(student_id))
             self.db.session.commit()
             return 
         except Exception as e:
@@ -924,65 +1511,253 @@ class Database:
 
     def get_course_by_course_grouping(self, course_grouping):
         try:
-            courses = self.db.session.query(Course).filter(Course.course_grouping == course_grouping).all()
-            for course in courses:
-                course.start_date = course.start_date.strftime("%Y-%m-%d")
-                course.end_date = course.end_date.strftime("%Y-%m-%d")
-                course.begin_time = course.begin_time.strftime("%H:%M")
-                course.end_time = course.end_time.strftime("%H:%M")
-            course_reprs = [course.to_dict() for course in courses]
-            return course_reprs
+            return serialize_courses(self.db.session, (Course.course_grouping == course_grouping,))
         except Exception as e:
             raise DatabaseError(f"Error fetching course by course grouping: {str(e)}")
 
-    def get_all_course_groupings_by_course_code(self, course_code, student_id):
-        student = self.db.session.query(Student).filter(Student.id == student_id).first()
+    def get_courses_by_course_groupings(self, course_groupings: list) -> list:
+        """
+        Get the meetings of several course groupings.
+
+        Args:
+        -----
+        course_groupings (list): The course groupings.
+
+        Returns:
+        --------
+        list: The serialized courses of the groupings, with the fields needed to check them for conflicts.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_courses_by_course_groupings(["COMP 1510-A-1", "COMP 1537-B-2"])
+        ... [{"id": 1, "course_grouping": "COMP 1510-A-1", "day": "Mon", "begin_time": "08:30", ...}]
+        """
         try:
-            courses = self.db.session.query(Course).filter(Course.course_code == course_code).all()
-            groupings_to_remove = []
-            for course in courses:
-                if course.status != "Active":
-                    groupings_to_remove.append(course.course_grouping)
-                if course.num_enrolled >= course.max_capacity and student not in course.students:
-                    groupings_to_remove.append(course.course_grouping)
-                course.start_date = course.start_date.strftime("%Y-%m-%d")
-                course.end_date = course.end_date.strftime("%Y-%m-%d")
-                course.begin_time = course.begin_time.strftime("%H:%M")
-                course.end_time = course.end_time.strftime("%H:%M")
-            for grouping in groupings_to_remove:
-                courses = [course for course in courses if course.course_grouping != grouping]
-            course_reprs = [course.to_dict() for course in courses]
-            course_groupings = {}
-            for course in course_reprs:
-                if course["course_grouping"] not in course_groupings:
-                    course_groupings[course["course_grouping"]] = []
-                course_groupings[course["course_grouping"]].append(course)
-            return course_groupings
+            return serialize_courses(
+                self.db.session,
+                (Course.course_grouping.in_(set(course_groupings)),),
+                fields=("id", "course_grouping", "course_code", "day", "begin_time", "end_time", "start_date", "end_date"),
+            )
+        except Exception as e:
+            raise DatabaseError(f"Error fetching courses by course groupings: {str(e)}")
+
+    def get_all_course_groupings_by_course_code(self, course_code: str, student_id: str) -> dict:
+        """
+        Get the course groupings of a course code that a student can be scheduled into.
+
+        Args:
+        -----
+        course_code (str): The course code.
+        student_id (str): The student ID.
+
+        Returns:
+        --------
+        dict: The courses of each available grouping, keyed by course grouping.
+
+        Notes:
+        ------
+        1. See get_course_groupings_by_course_codes.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_all_course_groupings_by_course_code("COMP 1510", "A00000001")
+        ... {"COMP 1510-A-1": [{"id": 1, "course_code": "COMP 1510", ...}]}
+        """
+        try:
+            return self.get_course_groupings_by_course_codes([course_code], student_id)[course_code]
         except Exception as e:
             raise DatabaseError(f"Error fetching course by course code: {str(e)}")
 
+    def get_course_groupings_by_course_codes(self, course_codes: list, student_id: str) -> dict:
+        """
+        Get the course groupings of several course codes that a student can be scheduled into.
+
+        Args:
+        -----
+        course_codes (list): The course codes.
+        student_id (str): The student ID.
+
+        Returns:
+        --------
+        dict: For each course code, the courses of each available grouping, keyed by course grouping.
+
+        Notes:
+        ------
+        1. Groupings with a course that is not active are excluded.
+        2. Groupings with a full course are excluded, unless the student is already enrolled in that course.
+        3. Course data comes from the course offering index; enrollment counts and the student's enrollments
+           for all course codes are read with a single query.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_course_groupings_by_course_codes(["COMP 1510", "COMP 1537"], "A00000001")
+        ... {"COMP 1510": {"COMP 1510-A-1": [...]}, "COMP 1537": {...}}
+        """
+        course_offerings = self.get_course_offerings()
+        enrollment = self.db.session.execute(
+            select(Course.id, Course.num_enrolled, enrollments.c.student_id)
+            .outerjoin(
+                enrollments,
+                (enrollments.c.course_id == Course.id) & (enrollments.c.student_id == student_id),
+            )
+            .where(Course.course_code.in_(set(course_codes)))
+        ).all()
+        num_enrolled = {course_id: count for course_id, count, _ in enrollment}
+        enrolled = {course_id for course_id, _, enrolled_student in enrollment if enrolled_student is not None}
+        course_groupings = {}
+        for course_code in course_codes:
+            course_groupings[course_code] = {}
+            for course_grouping, offering in course_offerings.get(course_code, {}).items():
+                if not offering["is_active"]:
+                    continue
+                courses = [
+                    {**course, "num_enrolled": num_enrolled.get(course["id"], course["num_enrolled"])}
+                    for course in offering["courses"]
+                ]
+                if any(course["num_enrolled"] >= course["max_capacity"] and course["id"] not in enrolled for course in courses):
+                    continue
+                course_groupings[course_code][course_grouping] = courses
+        return course_groupings
+
+    def get_course_groupings_by_student_preferences(self, student_id: str) -> dict:
+        """
+        Get the course groupings a student can be scheduled into for each of their preferences.
+
+        Args:
+        -----
+        student_id (str): The student ID.
+
+        Returns:
+        --------
+        dict: For each preferred course code, in priority order, the courses of each available grouping.
+
+        Raises:
+        -------
+        DataNotFound: If the student is not found.
+        DatabaseError: If the groupings cannot be fetched.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_course_groupings_by_student_preferences("A00000001")
+        ... {"COMP 1510": {"COMP 1510-A-1": [...]}, "COMP 1537": {...}}
+        """
+        try:
+            course_codes = list(dict.fromkeys(
+                preference for (preference,) in self.db.session.query(Preferences.preference)
+                .filter(Preferences.student_id == student_id)
+                .order_by(Preferences.priority)
+            ))
+            if not course_codes and not self.db.session.query(Student.id).filter(Student.id == student_id).first():
+                raise DataNotFound(f"Unable to find student by ID: {student_id}")
+            return self.get_course_groupings_by_course_codes(course_codes, student_id)
+        except DataNotFound:
+            raise
+        except Exception as e:
+            raise DatabaseError(f"Error fetching course groupings by student preferences: {str(e)}")
+
+    def get_course_offerings(self) -> dict:
+        """
+        Get the course offering index, building it if it is missing or older than COURSE_OFFERINGS_MAX_AGE seconds.
+
+        Returns:
+        --------
+        dict: course_code -> course_grouping -> {"is_active": bool, "courses": list of serialized courses, "time_grid": dict}.
+
+        Notes:
+        ------
+        1. The index is built from a single query over the courses table.
+        2. Imports in this process invalidate it immediately; the age limit picks up imports run by other worker processes.
+        3. Serialized courses do not list their students, and num_enrolled is the count when the index was built.
+        4. time_grid is the grouping's weekly time slot bitmask and date span, see Scheduler.encode_time_grid.
+        """
+        with self.course_offerings_lock:
+            if self.course_offerings is None or time.monotonic() - self.course_offerings_built_at > COURSE_OFFERINGS_MAX_AGE:
+                course_offerings = {}
+                for course in serialize_courses(self.db.session, fields=COURSE_COLUMNS):
+                    offering = course_offerings.setdefault(course["course_code"], {}).setdefault(
+                        course["course_grouping"], {"is_active": True, "courses": []}
+                    )
+                    offering["is_active"] = offering["is_active"] and course["status"] == "Active"
+                    offering["courses"].append(course)
+                course_grouping_offerings = {}
+                for groupings in course_offerings.values():
+                    for course_grouping, offering in groupings.items():
+                        offering["time_grid"] = self.scheduler.encode_time_grid(offering["courses"])
+                        course_grouping_offerings[course_grouping] = offering
+                self.course_offerings = course_offerings
+                self.course_grouping_offerings = course_grouping_offerings
+                self.course_offerings_built_at = time.monotonic()
+            return self.course_offerings
+
+    def invalidate_course_offerings(self) -> None:
+        """
+        Discard the course offering index so it is rebuilt on next use.
+
+        Returns:
+        --------
+        None
+        """
+        with self.course_offerings_lock:
+            self.course_offerings = None
+            self.course_grouping_offerings = None
+
+    def get_time_grids(self, course_groupings: list) -> dict:
+        """
+        Get the weekly time grids of several course groupings from the course offering index.
+
+        Args:
+        -----
+        course_groupings (list): The course groupings.
+
+        Returns:
+        --------
+        dict: course_grouping -> time grid, for the groupings that exist.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_time_grids(["COMP 1510-A-1"])
+        ... {"COMP 1510-A-1": {"time_slots": 1048560, "start_date": 739257, "end_date": 739352}}
+        """
+        with self.course_offerings_lock:
+            self.get_course_offerings()
+            course_grouping_offerings = self.course_grouping_offerings
+        return {
+            course_grouping: course_grouping_offerings[course_grouping]["time_grid"]
+            for course_grouping in course_groupings
+            if course_grouping in course_grouping_offerings
+        }
+
     def get_course_by_course_id(self, id):
         try:
-            course = self.db.session.query(Course).filter(Course.id == id).first()
-            if not course:
+            courses = serialize_courses(self.db.session, (Course.id == id,))
+            if not courses:
                 raise DataNotFound(f"Course with ID not found: {id}")
-            course.start_date = course.start_date.strftime("%Y-%m-%d")
-            course.end_date = course.end_date.strftime("%Y-%m-%d")
-            course.begin_time = course.begin_time.strftime("%H:%M")
-            course.end_time = course.end_time.strftime("%H:%M")
-            return course.to_dict()
+            return courses[0]
         except Exception as e:
             raise DatabaseError(f"Error fetching course by ID: {str(e)}")
 
     def get_course_students(self, course_grouping):
         try:
-            courses = self.db.session.query(Course).filter(Course.course_grouping == course_grouping).all()
+            courses = serialize_courses(self.db.session, (Course.course_grouping == course_grouping,), fields=("students",))
             if not courses:
                 raise DataNotFound(f"Course with course grouping not found: {course_grouping}")
-            students = []
-            for course in courses:
-                students.extend([student.to_dict() for student in course.students])
-            return students
+            enrolled = serialize_students(
+                self.db.session,
+                (
+                    Student.id.in_(
+                        select(enrollments.c.student_id)
+                        .join(Course, Course.id == enrollments.c.course_id)
+                        .where(Course.course_grouping == course_grouping)
+                    ),
+                ),
+            )
+            students = {student["id"]: student for student in enrolled}
+            return [students[student_id] for course in courses for student_id in course["students"]]
         except Exception as e:
             raise DatabaseError(f"Error fetching course students: {str(e)}")
 
@@ -1050,6 +1825,27 @@ class Database:
         self.db.session.commit()
         return
     
+    def rehash_password(self, user: User, password: str) -> None:
+        """
+        Replace the password hash of a user with a new hash of the same password.
+
+        Args
+        ----
+        user (User): The user object.
+        password (str): The new hash of the user's current password.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        1. Unlike update_password, a pending reset code is kept.
+        """
+        user.password = password
+        self.db.session.commit()
+        return
+
     def update_reset_code(self, user: User, reset_code: str) -> None:
         """
         Update the reset code for a user.
@@ -1082,6 +1878,7 @@ class Database:
         user.is_verified = True
         user.verification_code = None
         self.db.session.commit()
+        self.invalidate_user_auth_flags(user.id)
         return
     
     def get_user_by_id(self, user_id: int) -> User:
@@ -1105,6 +1902,55 @@ class Database:
             raise UserNotFound()
         return user
     
+    def get_user_auth_flags(self, user_id: int) -> dict:
+        """
+        Get the verified and admin flags of a user, cached for USER_AUTH_FLAGS_MAX_AGE seconds.
+
+        Args
+        ----
+        user_id (int): User ID.
+
+        Returns
+        -------
+        flags (dict): The user's is_verified and is_admin flags.
+
+        Raises
+        ------
+        UserNotFound: If the user is not found.
+
+        Notes
+        -----
+        1. Changes made through this process invalidate the cache at once; the age limit bounds how long
+           other worker processes can act on stale flags.
+        """
+        now = time.monotonic()
+        with self.user_auth_flags_lock:
+            cached = self.user_auth_flags.get(user_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        row = self.db.session.query(User.is_verified, User.is_admin).filter(User.id == user_id).first()
+        if not row:
+            raise UserNotFound()
+        flags = {"is_verified": bool(row.is_verified), "is_admin": bool(row.is_admin)}
+        with self.user_auth_flags_lock:
+            self.user_auth_flags[user_id] = (now + USER_AUTH_FLAGS_MAX_AGE, flags)
+        return flags
+
+    def invalidate_user_auth_flags(self, user_id: int) -> None:
+        """
+        Discard the cached flags of a user.
+
+        Args
+        ----
+        user_id (int): User ID.
+
+        Returns
+        -------
+        None
+        """
+        with self.user_auth_flags_lock:
+            self.user_auth_flags.pop(user_id, None)
+
     def get_all_users_info(self) -> list[dict]:
         """
         Get all users.
@@ -1147,6 +1993,8 @@ class Database:
             self.db.session.commit()
         except Exception as e:
             raise DatabaseError(f"Error changing user admin status: {str(e)}")
+        finally:
+            self.invalidate_user_auth_flags(user_id)
         return
 
     def update_user_info(self, user_id: int, username: str, email: str) -> None:
@@ -1189,6 +2037,7 @@ class Database:
             raise DatabaseError("Cannot delete admin user")
         self.db.session.query(User).filter(User.id == user_id).delete()
         self.db.session.commit()
+        self.invalidate_user_auth_flags(user_id)
         return
 
     def create_unverified_user(self, username: str, email: str, password: str, verification_code: str) -> User:
@@ -1280,13 +2129,47 @@ class Database:
         except Exception as e:
             self.db.session.rollback()
             raise DatabaseError(f"Error verifying user and setting password: {str(e)}")
+        finally:
+            self.invalidate_user_auth_flags(user.id)
 
     def get_jumbotron_data(self) -> dict:
         """
+        Get the student counts shown on the dashboard.
+
+        Args:
+        -----
+        None
+
+        Returns:
+        --------
+        dict: The total students and the students with schedules in progress, finalized, or without a course.
+
+        Notes:
+        ------
+        1. The counts are read from the single dashboard_stats row, which the methods changing students and
+           enrollments keep up to date in their own transactions.
+        2. If the row does not exist yet, it is counted from the students and enrollments tables first.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_jumbotron_data()
+        ... {"total_students": 120, "total_schedules_in_progress": 40, "total_schedules_finalized": 60, "total_students_without_course": 20}
         """
-        total_students = self.db.session.query(Student).count()
-        total_students_with_schedules_finalized = self.db.session.query(Student).filter(Student.is_completed == True, Student.is_approved_by_program_heads==True).count()
-        total_students_with_courses = self.db.session.query(Student).filter(or_(Student.courses.any(), Student.is_completed == True)).count()
+        stats = DashboardStats.__table__
+        query = select(stats).where(stats.c.id == DASHBOARD_STATS_ID)
+        row = self.db.session.execute(query).first()
+        if row is None:
+            try:
+                self.refresh_dashboard_stats()
+                self.db.session.commit()
+            except IntegrityError:
+                # Another worker created the row first
+                self.db.session.rollback()
+            row = self.db.session.execute(query).first()
+        total_students = row.total_students
+        total_students_with_schedules_finalized = row.schedules_finalized
+        total_students_with_courses = row.students_with_courses
         total_students_with_schedules_in_progress = total_students_with_courses - total_students_with_schedules_finalized
         total_students_without_course = total_students - total_students_with_courses
         return {
@@ -1296,11 +2179,124 @@ class Database:
             "total_students_without_course": total_students_without_course
         }
 
+    def get_dashboard_state(self, student_id: str) -> tuple:
+        """
+        Get how a student counts towards the dashboard statistics.
+
+        Args:
+        -----
+        student_id (str): The student ID.
+
+        Returns:
+        --------
+        tuple: Whether the student exists, has courses or a completed schedule, and has a finalized schedule.
+
+        Notes:
+        ------
+        1. Pending changes in the session are flushed first, so the state after a change can be compared with the
+           state before it.
+        """
+        has_courses = select(enrollments.c.student_id).where(enrollments.c.student_id == student_id).exists()
+        row = (
+            self.db.session.query(Student.is_completed, Student.is_approved_by_program_heads, has_courses)
+            .filter(Student.id == student_id)
+            .first()
+        )
+        if not row:
+            return (False, False, False)
+        is_completed, is_approved_by_program_heads, has_courses = row
+        return (True, bool(has_courses or is_completed), bool(is_completed and is_approved_by_program_heads))
+
+    def update_dashboard_stats(self, before: tuple, after: tuple) -> None:
+        """
+        Apply the change in a student's dashboard state to the dashboard statistics.
+
+        Args:
+        -----
+        before (tuple): The state from get_dashboard_state before the change.
+        after (tuple): The state from get_dashboard_state after the change.
+
+        Returns:
+        --------
+        None
+        """
+        total_students, students_with_courses, schedules_finalized = (
+            int(new) - int(old) for old, new in zip(before, after)
+        )
+        self.add_to_dashboard_stats(total_students, students_with_courses, schedules_finalized)
+
+    def add_to_dashboard_stats(self, total_students: int = 0, students_with_courses: int = 0, schedules_finalized: int = 0) -> None:
+        """
+        Add to the dashboard statistics in the current transaction.
+
+        Args:
+        -----
+        total_students (int): The change in the number of students.
+        students_with_courses (int): The change in the number of students with courses or a completed schedule.
+        schedules_finalized (int): The change in the number of completed and approved schedules.
+
+        Returns:
+        --------
+        None
+
+        Notes:
+        ------
+        1. The counts are changed with a single relative UPDATE, so concurrent changes from other workers are not lost.
+        2. Nothing is done if the row does not exist yet; get_jumbotron_data counts it from scratch.
+        """
+        if not (total_students or students_with_courses or schedules_finalized):
+            return
+        stats = DashboardStats.__table__
+        self.db.session.execute(
+            update(stats)
+            .where(stats.c.id == DASHBOARD_STATS_ID)
+            .values(
+                total_students=stats.c.total_students + total_students,
+                students_with_courses=stats.c.students_with_courses + students_with_courses,
+                schedules_finalized=stats.c.schedules_finalized + schedules_finalized,
+            )
+        )
+
+    def refresh_dashboard_stats(self) -> None:
+        """
+        Count the dashboard statistics from the students and enrollments tables in the current transaction.
+
+        Args:
+        -----
+        None
+
+        Returns:
+        --------
+        None
+
+        Notes:
+        ------
+        1. Used by the imports, which change too many students to track one by one.
+        """
+        has_courses = select(enrollments.c.student_id).where(enrollments.c.student_id == Student.id).exists()
+        total_students, students_with_courses, schedules_finalized = self.db.session.query(
+            func.count(Student.id),
+            func.coalesce(func.sum(case((or_(has_courses, Student.is_completed == True), 1), else_=0)), 0),
+            func.coalesce(
+                func.sum(case((and_(Student.is_completed == True, Student.is_approved_by_program_heads == True), 1), else_=0)), 0
+            ),
+        ).one()
+        counts = {
+            "total_students": total_students,
+            "students_with_courses": students_with_courses,
+            "schedules_finalized": schedules_finalized,
+        }
+        stats = DashboardStats.__table__
+        if self.db.session.execute(update(stats).where(stats.c.id == DASHBOARD_STATS_ID).values(**counts)).rowcount == 0:
+            self.db.session.execute(insert(stats).values(id=DASHBOARD_STATS_ID, **counts))
+
     def flip_mark_done(self, student_id) -> None:
         """
         """
         student = self.db.session.query(Student).filter(Student.id == student_id).first()
+        before = self.get_dashboard_state(student_id)
         student.is_completed = not student.is_completed
+        self.update_dashboard_stats(before, self.get_dashboard_state(student_id))
         today = datetime.now().date()
         today = today.strftime("%Y-%m-%d")
         schedule_progression = self.db.session.query(ScheduleProgression).filter(ScheduleProgression.date == today).first()
@@ -1320,7 +2316,9 @@ class Database:
         """
         """
         student = self.db.session.query(Student).filter(Student.id == student_id).first()
+        before = self.get_dashboard_state(student_id)
         student.is_approved_by_program_heads = not student.is_approved_by_program_heads
+        self.update_dashboard_stats(before, self.get_dashboard_state(student_id))
         today = datetime.now().date()
         today = today.strftime("%Y-%m-%d")
         schedule_progression = self.db.session.query(ScheduleProgression).filter(ScheduleProgression.date == today).first()
@@ -1340,9 +2338,11 @@ class Database:
         """
         """
         student = self.db.session.query(Student).filter(Student.id == student_id).first()
+        before = self.get_dashboard_state(student_id)
         for course in student.courses:
             course.num_enrolled -= 1
         student.courses = []
+        self.update_dashboard_stats(before, self.get_dashboard_state(student_id))
         self.db.session.commit()
         return
     
@@ -1350,6 +2350,7 @@ class Database:
         """
         """
         student = self.db.session.query(Student).filter(Student.id == student_id).first()
+        before = self.get_dashboard_state(student_id)
         for grouping in groupings_list:
             courses = self.db.session.query(Course).filter(Course.course_grouping == grouping).all()
             if not courses:
@@ -1357,11 +2358,157 @@ class Database:
             for course in courses:
                 student.courses.append(course)
                 course.num_enrolled += 1
+        self.update_dashboard_stats(before, self.get_dashboard_state(student_id))
         self.db.session.commit()
         return
 
-    def save_schedules_to_local_file(self) -> list:
+    def auto_schedule_students(self, scheduler, progress: callable = None) -> dict:
+        """
+        Assign course groupings to every student still waiting for a schedule.
+
+        Args:
+        -----
+        scheduler (Scheduler): The scheduler used to assign the course groupings.
+        progress (callable): Called with keyword counts (students_considered, students_scheduled) as the run advances.
+
+        Returns:
+        --------
+        dict: The number of students considered and scheduled, the number of groupings assigned, and the
+              unplaced preferences of each student.
+
+        Notes:
+        ------
+        1. Students with preferences, no completed schedule and no enrolled courses are scheduled.
+        2. Only active groupings are used, limited to their remaining capacity (max_capacity - num_enrolled of their fullest course).
+        3. All enrollments are written in one transaction with enroll_students_in_groupings.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.auto_schedule_students(Scheduler())
+        ... {"students_considered": 120, "students_scheduled": 118, "groupings_assigned": 640, "unplaced": [...]}
+        """
+        try:
+            preferences = {}
+            cohort = (
+                self.db.session.query(Preferences.student_id, Preferences.preference)
+                .join(Student, Student.id == Preferences.student_id)
+                .filter(Student.is_completed == False, ~Student.courses.any())
+                .order_by(Preferences.student_id, Preferences.priority)
+            )
+            for student_id, preference in cohort:
+                preferences.setdefault(student_id, []).append(preference)
+            course_codes = {course_code for codes in preferences.values() for course_code in codes}
+            course_offerings = self.get_course_offerings()
+            groupings_by_course_code = {
+                course_code: {
+                    course_grouping: offering["courses"]
+                    for course_grouping, offering in course_offerings.get(course_code, {}).items()
+                    if offering["is_active"]
+                }
+                for course_code in course_codes
+            }
+            remaining_capacity = {}
+            capacity = self.db.session.query(
+                Course.course_grouping, func.min(Course.max_capacity - Course.num_enrolled)
+            ).filter(Course.course_code.in_(course_codes)).group_by(Course.course_grouping)
+            for course_grouping, remaining in capacity:
+                remaining_capacity[course_grouping] = max(remaining, 0)
+        except Exception as e:
+            raise DatabaseError(f"Error querying into database: {str(e)}")
+        if progress:
+            progress(students_considered=len(preferences))
+
+        assignments, unplaced = scheduler.assign_cohort(preferences, groupings_by_course_code, remaining_capacity)
+        self.enroll_students_in_groupings(assignments)
+        students_scheduled = sum(1 for groupings in assignments.values() if groupings)
+        if progress:
+            progress(students_scheduled=students_scheduled)
+        return {
+            "students_considered": len(preferences),
+            "students_scheduled": students_scheduled,
+            "groupings_assigned": sum(len(groupings) for groupings in assignments.values()),
+            "unplaced": [
+                {"student_id": student_id, "course_codes": course_codes}
+                for student_id, course_codes in sorted(unplaced.items())
+                if course_codes
+            ],
+        }
+
+    def enroll_students_in_groupings(self, assignments: dict) -> None:
+        """
+        Enroll students in course groupings in a single transaction.
+
+        Args:
+        -----
+        assignments (dict): A mapping of student ID to the course groupings to enroll them in.
+
+        Returns:
+        --------
+        None
+
+        Notes:
+        ------
+        1. Enrollments are bulk inserted and num_enrolled is incremented with one executemany UPDATE.
+        2. Students enrolled in their first course are added to the dashboard statistics in the same transaction.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.enroll_students_in_groupings({"A01234567": ["1ACOMP 1510"]})
+        ... # Student enrolled in every course of grouping 1ACOMP 1510
         """
+        course_groupings = {course_grouping for groupings in assignments.values() for course_grouping in groupings}
+        try:
+            grouping_courses = {}
+            for course_id, course_grouping in self.db.session.query(Course.id, Course.course_grouping).filter(
+                Course.course_grouping.in_(course_groupings)
+            ):
+                grouping_courses.setdefault(course_grouping, []).append(course_id)
+            new_enrollments = [
+                {"student_id": student_id, "course_id": course_id}
+                for student_id, groupings in assignments.items()
+                for course_grouping in groupings
+                for course_id in grouping_courses.get(course_grouping, [])
+            ]
+            if new_enrollments:
+                enrolled_students = {enrollment["student_id"] for enrollment in new_enrollments}
+                students_with_courses = self.db.session.query(func.count(Student.id)).filter(
+                    Student.id.in_(enrolled_students), Student.is_completed == False, ~Student.courses.any()
+                ).scalar()
+                self.bulk_insert_rows(enrollments, new_enrollments)
+                self.add_to_dashboard_stats(students_with_courses=students_with_courses)
+                added = {}
+                for enrollment in new_enrollments:
+                    added[enrollment["course_id"]] = added.get(enrollment["course_id"], 0) + 1
+                courses = Course.__table__
+                self.db.session.execute(
+                    update(courses)
+                    .where(courses.c.id == bindparam("course_id"))
+                    .values(num_enrolled=courses.c.num_enrolled + bindparam("added")),
+                    [{"course_id": course_id, "added": count} for course_id, count in added.items()],
+                )
+            self.db.session.commit()
+        except Exception as e:
+            self.db.session.rollback()
+            raise DatabaseError(f"Error enrolling students: {str(e)}")
+
+    def save_schedules_to_local_file(self, progress: callable = None, file_path: str = None) -> str:
+        """
+        Export every student's schedule to a CSV file.
+
+        Args:
+        -----
+        progress (callable): Called with rows_exported once the rows are built.
+        file_path (str): The file to write, or None for a new file in the exports folder.
+
+        Returns:
+        --------
+        str: The path of the written file.
+
+        Notes:
+        ------
+        1. Every export gets its own file, so concurrent exports never overwrite each other.
         """
         # get all students
         schedule = []
@@ -1388,6 +2535,8 @@ class Database:
                     course.instructor
                 ]
                 schedule.append(row)
+        if progress:
+            progress(rows_exported=len(schedule))
         df = pd.DataFrame(schedule, columns=[
             "Student ID",
             "First Name",
@@ -1407,9 +2556,10 @@ class Database:
             "Building Room",
             "Instructor"
         ])
-        file_path = os.path.join(current_app.root_path, 'exports/schedule.csv')
-        if not os.path.exists(os.path.join(current_app.root_path, 'exports')):
-            os.makedirs(os.path.join(current_app.root_path, 'exports'))
+        if file_path is None:
+            exports_folder = os.path.join(current_app.root_path, 'exports')
+            os.makedirs(exports_folder, exist_ok=True)
+            file_path = os.path.join(exports_folder, f"schedule-{uuid.uuid4().hex}.csv")
         df.to_csv(file_path, index=False)
         return file_path
     
@@ -1425,41 +2575,87 @@ class Database:
         }
         return information
     
-    def get_most_popular_preferences(self) -> dict:
-        """
-        """
-        preferences = self.db.session.query(Preferences).all()
-        preferences_scores = {}
-        preferences_counts = {}
-        max_points = 8
-        for preference in preferences:
-            if preference.preference not in preferences_scores:
-                preferences_scores[preference.preference] = 0
-                preferences_counts[preference.preference] = 0
-            preferences_scores[preference.preference] += max_points - (preference.priority - 1)
-            preferences_counts[preference.preference] += 1
-        preferences_avg_rank = {
-            pref: (max_points - (preferences_scores[pref] / preferences_counts[pref]) + 1)
-            for pref in preferences_scores
-        }
-        sorted_preferences = sorted(preferences_avg_rank.items(), key=lambda item: item[1])
-        top_preferences = [{pref[0]: pref[1]} for pref in sorted_preferences[:5]]
-        return top_preferences
-    
-    def get_most_popular_course_registrations(self) -> dict:
+    def get_most_popular_preferences(self, limit: int = POPULAR_COURSES_DEFAULT_LIMIT, term_code: int = None) -> list:
         """
+        Get the course codes students rank highest among their preferences.
+
+        Args:
+        -----
+        limit (int): The maximum number of course codes to return, capped at POPULAR_COURSES_MAX_LIMIT.
+        term_code (int): Only count the preferences of students in this term.
+
+        Returns:
+        --------
+        list: One {course_code: average_rank} dictionary per course code, best (lowest) average rank first.
+
+        Notes:
+        ------
+        1. The course codes are ordered by AVG(priority) in a single GROUP BY query; ties go to the course code
+           chosen by more students, then to the lower course code.
+        2. The average rank returned is SUM(priority) / COUNT(*) as a float. MySQL returns both AVG and an integer
+           SUM as Decimal (which jsonify renders as a string), and AVG only to 4 decimal places.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_most_popular_preferences(limit=2, term_code=202510)
+        ... [{"COMP 1510": 1.25}, {"COMP 1537": 2.5}]
         """
-        students = self.db.session.query(Student).all()
-        course_codes = {}
-        for student in students:
-            student_courses = set()
-            for course in student.courses:
-                student_courses.add(course.course_code)
-            for course in student_courses:
-                if course not in course_codes:
-                    course_codes[course] = 0
-                course_codes[course] += 1
-        sorted_course_codes = sorted(course_codes.items(), key=lambda item: item[1], reverse=True)
-        sorted_course_codes = sorted_course_codes[:5]
-        sorted_courses_list = [{sorted_course_codes[i][0]: sorted_course_codes[i][1]} for i in range(len(sorted_course_codes))]
-        return sorted_courses_list
\ No newline at end of file
+        limit = max(1, min(limit, POPULAR_COURSES_MAX_LIMIT))
+        try:
+            query = self.db.session.query(
+                Preferences.preference, func.sum(Preferences.priority), func.count()
+            )
+            if term_code is not None:
+                query = query.join(Student, Student.id == Preferences.student_id).filter(Student.term_code == term_code)
+            rows = (
+                query.group_by(Preferences.preference)
+                .order_by(func.avg(Preferences.priority), func.count().desc(), Preferences.preference)
+                .limit(limit)
+                .all()
+            )
+        except Exception as e:
+            raise DatabaseError(f"Error querying into database: {str(e)}")
+        return [{preference: float(total) / count} for preference, total, count in rows]
+
+    def get_most_popular_course_registrations(self, limit: int = POPULAR_COURSES_DEFAULT_LIMIT, term_code: int = None) -> list:
+        """
+        Get the course codes with the most registered students.
+
+        Args:
+        -----
+        limit (int): The maximum number of course codes to return, capped at POPULAR_COURSES_MAX_LIMIT.
+        term_code (int): Only count students in this term.
+
+        Returns:
+        --------
+        list: One {course_code: student_count} dictionary per course code, most students first.
+
+        Notes:
+        ------
+        1. Students are counted once per course code however many of its courses they are enrolled in, with
+           COUNT(DISTINCT student_id) over enrollments joined to courses in a single GROUP BY query.
+
+        Example:
+        --------
+        >>> db = Database()
+        >>> db.get_most_popular_course_registrations(limit=2)
+        ... [{"COMP 1510": 84}, {"COMP 1537": 80}]
+        """
+        limit = max(1, min(limit, POPULAR_COURSES_MAX_LIMIT))
+        student_count = func.count(enrollments.c.student_id.distinct())
+        try:
+            query = self.db.session.query(Course.course_code, student_count).join(
+                enrollments, enrollments.c.course_id == Course.id
+            )
+            if term_code is not None:
+                query = query.join(Student, Student.id == enrollments.c.student_id).filter(Student.term_code == term_code)
+            rows = (
+                query.group_by(Course.course_code)
+                .order_by(student_count.desc(), Course.course_code)
+                .limit(limit)
+                .all()
+            )
+        except Exception as e:
+            raise DatabaseError(f"Error querying into database: {str(e)}")
+        return [{course_code: count} for course_code, count in rows]
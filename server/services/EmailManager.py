@@ -1,44 +1,272 @@
 # EmailManager.py
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+import atexit
+import logging
+import queue
 import smtplib
+import threading
+import time
+
+from exceptions import EmailQueueFull
+
+
+# CONSTANTS
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 465
+EMAIL_QUEUE_SIZE = 1000
+EMAIL_MAX_RETRIES = 3
+EMAIL_RETRY_BACKOFF = 2.0
+SMTP_IDLE_TIMEOUT = 60
+logger = logging.getLogger(__name__)
+
 
 class EmailManager:
     """
     Handles email operations using Gmail SMTP
+
+    Emails are sent over a single authenticated connection that is kept open between messages and reopened when the
+    server drops it. By default they are handed to a background sender thread through a bounded queue, so requests
+    do not wait on TLS and authentication.
     """
-    def __init__(self, gmail_user: str, gmail_password: str, client_url: str):
+    def __init__(
+        self,
+        gmail_user: str,
+        gmail_password: str,
+        client_url: str,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        use_ssl: bool = True,
+        queue_size: int = EMAIL_QUEUE_SIZE,
+        max_retries: int = EMAIL_MAX_RETRIES,
+        retry_backoff: float = EMAIL_RETRY_BACKOFF,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT,
+    ):
         """
         Initialize EmailManager with Gmail credentials
-        
+
         Args:
             gmail_user (str): Gmail email address
-            gmail_password (str): Gmail app password
+            gmail_password (str): Gmail app password, or None to send without logging in
             client_url (str): Base URL of your application
+            host (str): SMTP server host
+            port (int): SMTP server port
+            use_ssl (bool): Whether to connect with SMTP_SSL instead of plain SMTP
+            queue_size (int): Most emails waiting for the sender thread
+            max_retries (int): Retries of a failed send before the email is dropped
+            retry_backoff (float): Seconds before the first retry, doubled for each further retry
+            idle_timeout (float): Seconds without emails before the connection is closed
         """
         self.gmail_user = gmail_user
         self.gmail_password = gmail_password
         self.client_url = client_url
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.idle_timeout = idle_timeout
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.connection = None
+        self.connection_lock = threading.Lock()
+        self.sender = None
+        self.sender_lock = threading.Lock()
+        self.failed = 0
+        # Registered once here, as the sender thread may be started again
+        atexit.register(self.flush)
 
-    def send_verification_email(self, to_email: str, username: str, verification_code: str) -> None:
+    def _connect(self) -> smtplib.SMTP:
         """
-        Send verification email with confirmation link
-        
+        Open and authenticate a new SMTP connection
+
+        Returns:
+            smtplib.SMTP: The connection
+        """
+        if self.use_ssl:
+            connection = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
+        else:
+            connection = smtplib.SMTP(self.host, self.port, timeout=30)
+        try:
+            if self.gmail_password:
+                connection.login(self.gmail_user, self.gmail_password)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def _disconnect(self) -> None:
+        """
+        Close the SMTP connection, if open. Must be called with connection_lock held.
+        """
+        if self.connection is None:
+            return
+        try:
+            self.connection.quit()
+        except smtplib.SMTPException:
+            pass
+        except OSError:
+            pass
+        finally:
+            self.connection.close()
+            self.connection = None
+
+    def _is_transient(self, error: Exception) -> bool:
+        """
+        Check whether a failed send is worth retrying
+
+        Args:
+            error (Exception): The error raised by the send
+
+        Returns:
+            bool: False for permanent (5xx) and refused recipient errors, otherwise True
+        """
+        if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused)):
+            return False
+        if isinstance(error, smtplib.SMTPResponseException):
+            return not 500 <= error.smtp_code < 600
+        return isinstance(error, (smtplib.SMTPException, OSError))
+
+    def _deliver(self, msg: MIMEMultipart) -> None:
+        """
+        Send a message over the shared connection, reconnecting and retrying with backoff on transient failures
+
+        Args:
+            msg (MIMEMultipart): The message to send
+
+        Raises:
+            Exception: If the message could not be sent
+        """
+        attempt = 0
+        while True:
+            with self.connection_lock:
+                reused = self.connection is not None
+                try:
+                    if self.connection is None:
+                        self.connection = self._connect()
+                    self.connection.send_message(msg)
+                    return
+                except Exception as e:
+                    self._disconnect()
+                    # A reused connection may simply have been dropped by the server while idle
+                    if reused and isinstance(e, smtplib.SMTPServerDisconnected):
+                        continue
+                    if attempt >= self.max_retries or not self._is_transient(e):
+                        raise Exception(f"Failed to send email: {str(e)}")
+            time.sleep(self.retry_backoff * 2 ** attempt)
+            attempt += 1
+
+    def _start_sender(self) -> None:
+        """
+        Start the background sender thread if it is not running
+
+        Notes:
+            The thread is started lazily so that each worker process starts its own after forking.
+        """
+        with self.sender_lock:
+            if self.sender is not None and self.sender.is_alive():
+                return
+            self.sender = threading.Thread(target=self._send_queued, name="email-sender", daemon=True)
+            self.sender.start()
+
+    def _send_queued(self) -> None:
+        """
+        Send queued messages until the process exits, closing the connection while idle
+        """
+        while True:
+            try:
+                msg = self.queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self.connection_lock:
+                    self._disconnect()
+                continue
+            try:
+                self._deliver(msg)
+            except Exception as e:
+                self.failed += 1
+                logger.error("Dropped email to %s: %s", msg['To'], e)
+            finally:
+                self.queue.task_done()
+
+    def send(self, msg: MIMEMultipart, background: bool = True) -> None:
+        """
+        Send a message
+
+        Args:
+            msg (MIMEMultipart): The message to send
+            background (bool): Whether to queue the message for the sender thread instead of sending it now
+
+        Raises:
+            EmailQueueFull: If the message is queued and the queue is full
+            Exception: If the message is sent now and fails
+        """
+        if not background:
+            self._deliver(msg)
+            return
+        self._start_sender()
+        try:
+            self.queue.put_nowait(msg)
+        except queue.Full:
+            raise EmailQueueFull()
+
+    def send_bulk(self, msgs: list, timeout: float = None) -> None:
+        """
+        Queue many messages for the sender thread, which sends them all over one connection
+
+        Args:
+            msgs (list): The messages to send
+            timeout (float): Seconds to wait for room in the queue for each message, or None to wait as long as needed
+
+        Raises:
+            EmailQueueFull: If there is no room in the queue within the timeout
+        """
+        self._start_sender()
+        for msg in msgs:
+            try:
+                self.queue.put(msg, timeout=timeout)
+            except queue.Full:
+                raise EmailQueueFull()
+
+    def flush(self, timeout: float = 30) -> bool:
+        """
+        Wait for the queued messages to be sent
+
+        Args:
+            timeout (float): Most seconds to wait
+
+        Returns:
+            bool: True if the queue was emptied, otherwise False
+        """
+        deadline = time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def build_verification_email(self, to_email: str, username: str, verification_code: str) -> MIMEMultipart:
+        """
+        Build a verification email with confirmation link
+
         Args:
             to_email (str): Recipient's email address
             username (str): Username of the new user
             verification_code (str): Verification code for the user
+
+        Returns:
+            MIMEMultipart: The message
         """
         msg = MIMEMultipart()
         msg['From'] = self.gmail_user
         msg['To'] = to_email
         msg['Subject'] = "BCIT Account Verification"
-        
+
         # Ensure we're using the React app URL
         body = f"""
         Hello {username},
 
-        An administrator has created an account for you at BCIT Global Relations Office. 
+        An administrator has created an account for you at BCIT Global Relations Office.
 
         Your one time verification code is: {verification_code}
 
@@ -52,26 +280,47 @@ class EmailManager:
         BCIT Global Relations Office
         """
         msg.attach(MIMEText(body, 'plain'))
-        try:
-            server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
-            server.login(self.gmail_user, self.gmail_password)
-            server.send_message(msg)
-            server.close()
-        except Exception as e:
-            raise Exception(f"Failed to send email: {str(e)}")
-        
-    def forgot_password_email(self, to_email: str, reset_code: str) -> None:
+        return msg
+
+    def send_verification_email(self, to_email: str, username: str, verification_code: str, background: bool = True) -> None:
         """
+        Send verification email with confirmation link
+
+        Args:
+            to_email (str): Recipient's email address
+            username (str): Username of the new user
+            verification_code (str): Verification code for the user
+            background (bool): Whether to queue the email for the sender thread instead of sending it now
+        """
+        self.send(self.build_verification_email(to_email, username, verification_code), background)
+
+    def send_verification_emails(self, recipients: list) -> None:
+        """
+        Queue verification emails for many new users at once
+
+        Args:
+            recipients (list): Dictionaries with the to_email, username and verification_code of each user
+        """
+        self.send_bulk([self.build_verification_email(**recipient) for recipient in recipients])
+
+    def forgot_password_email(self, to_email: str, reset_code: str, background: bool = True) -> None:
+        """
+        Send password reset email with a one time reset code
+
+        Args:
+            to_email (str): Recipient's email address
+            reset_code (str): Reset code for the user
+            background (bool): Whether to queue the email for the sender thread instead of sending it now
         """
         msg = MIMEMultipart()
         msg['From'] = self.gmail_user
         msg['To'] = to_email
         msg['Subject'] = "BCIT Password Reset"
-        
+
         body = f"""
         Hello,
 
-        You have requested to reset your password at BCIT Global Relations Office. 
+        You have requested to reset your password at BCIT Global Relations Office.
 
         Your one time reset code is: {reset_code}
 
@@ -81,10 +330,4 @@ class EmailManager:
         BCIT Global Relations Office
         """
         msg.attach(MIMEText(body, 'plain'))
-        try:
-            server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
-            server.login(self.gmail_user, self.gmail_password)
-            server.send_message(msg)
-            server.close()
-        except Exception as e:
-            raise Exception(f"Failed to send email: {str(e)}")
+        self.send(msg, background)
@@ -0,0 +1,434 @@
+"""
+"""
+
+# IMPORTS
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.utils import secure_filename
+
+from exceptions import JobNotFound
+
+
+# CONSTANTS
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_POLL_INTERVAL = 2
+JOB_HEARTBEAT_INTERVAL = 30
+JOB_STALE_AFTER = timedelta(minutes=5)
+JOB_MAX_ATTEMPTS = 2
+JOB_RETENTION = timedelta(days=7)
+JOB_COLUMNS = {
+    "upload_path": "TEXT",
+    "upload_filename": "TEXT",
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+# JOB MANAGER CLASS
+class JobManager:
+    """
+    A class used to run long imports and exports in the background.
+
+    The jobs table of a SQLite file inside the jobs folder is the queue: every worker process runs a few threads that
+    claim queued rows, so any worker process can report the status of a job, a job outlives the process that queued
+    it, and no external queue service is needed. Uploads and exported files are stored on disk next to it.
+    """
+    def __init__(self, jobs_folder: str, max_workers: int = 2):
+        """
+        Initialize the JobManager class.
+
+        Args
+        ----
+        jobs_folder (str): The folder used for the job database, stored uploads and exported files.
+        max_workers (int): The number of jobs run at the same time by this process.
+        """
+        self.jobs_folder = jobs_folder
+        self.database_path = os.path.join(jobs_folder, "jobs.sqlite3")
+        self.max_workers = max_workers
+        self.tasks = {}
+        self.wakeup = threading.Event()
+        self.threads = []
+        os.makedirs(jobs_folder, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+            for column, definition in JOB_COLUMNS.items():
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+            connection.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self.recover_stale_jobs()
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection to the job database, committing and closing it on exit.
+
+        Args
+        ----
+        None
+
+        Yields
+        ------
+        sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.database_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def output_path(self, job_id: str) -> str:
+        """
+        Get the path of the file exported by a job.
+
+        Args
+        ----
+        job_id (str): The job ID.
+
+        Returns
+        -------
+        str: The path, inside the jobs folder.
+        """
+        return os.path.join(self.jobs_folder, f"{job_id}.csv")
+
+    def start(self, app, tasks: dict) -> None:
+        """
+        Start the threads that run queued jobs in this process.
+
+        Args
+        ----
+        app (Flask): The Flask application, used to give the tasks an application context.
+        tasks (dict): A mapping of job type to task, each called as task(job_id, file, progress) with file None
+                      when the job has no upload.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        1. Tasks are looked up by job type because the queue outlives the process that queued the job.
+        """
+        self.tasks = tasks
+        for index in range(self.max_workers):
+            thread = threading.Thread(target=self._work, args=(app,), name=f"job-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, job_type: str, file: FileStorage = None) -> str:
+        """
+        Store the upload (if any) and queue a job.
+
+        Args
+        ----
+        job_type (str): The type of the job, one of the keys of the tasks given to start, e.g. "course_replace".
+        file (FileStorage): The uploaded file to hand to the task.
+
+        Returns
+        -------
+        str: The job ID.
+        """
+        job_id = uuid.uuid4().hex
+        upload_path = upload_filename = None
+        if file is not None:
+            upload_path = os.path.join(self.jobs_folder, f"{job_id}.upload")
+            upload_filename = secure_filename(file.filename)
+            file.save(upload_path)
+        now = datetime.now().isoformat()
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT INTO jobs (id, type, status, progress, upload_path, upload_filename, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, job_type, JOB_QUEUED, "{}", upload_path, upload_filename, now, now),
+            )
+        self.wakeup.set()
+        return job_id
+
+    def _work(self, app) -> None:
+        """
+        Claim and run queued jobs until the process exits.
+
+        Args
+        ----
+        app (Flask): The Flask application.
+
+        Returns
+        -------
+        None
+        """
+        while True:
+            job = self._claim()
+            if job is None:
+                self.wakeup.wait(JOB_POLL_INTERVAL)
+                self.wakeup.clear()
+                self.recover_stale_jobs()
+                self.delete_old_jobs()
+                continue
+            self._run(app, *job)
+
+    def _claim(self) -> tuple:
+        """
+        Claim the oldest queued job.
+
+        Args
+        ----
+        None
+
+        Returns
+        -------
+        tuple: The job ID, type, stored upload path and original filename, or None if no job is queued.
+
+        Notes
+        -----
+        1. The status is only changed if the job is still queued, so a job is claimed by exactly one thread of one
+           process even when several try at once.
+        """
+        while True:
+            with self._connect() as connection:
+                row = connection.execute(
+                    """
+                    SELECT id, type, upload_path, upload_filename FROM jobs
+                    WHERE status = ? ORDER BY created_at LIMIT 1
+                    """,
+                    (JOB_QUEUED,),
+                ).fetchone()
+                if row is None:
+                    return None
+                claimed = connection.execute(
+                    """
+                    UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ?
+                    WHERE id = ? AND status = ?
+                    """,
+                    (JOB_RUNNING, datetime.now().isoformat(), row[0], JOB_QUEUED),
+                ).rowcount
+            if claimed:
+                return row
+
+    def _run(self, app, job_id: str, job_type: str, upload_path: str, upload_filename: str) -> None:
+        """
+        Run a claimed job and record its result.
+
+        Args
+        ----
+        app (Flask): The Flask application.
+        job_id (str): The job ID.
+        job_type (str): The type of the job.
+        upload_path (str): The stored upload path, or None.
+        upload_filename (str): The original filename of the upload, or None.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        1. updated_at is refreshed every JOB_HEARTBEAT_INTERVAL seconds while the task runs, so that a job is only
+           treated as stale once the process running it is gone.
+        """
+        progress = lambda **counts: self.update_progress(job_id, **counts)
+        finished = threading.Event()
+
+        def heartbeat():
+            while not finished.wait(JOB_HEARTBEAT_INTERVAL):
+                self._update(job_id)
+
+        threading.Thread(target=heartbeat, name=f"job-heartbeat-{job_id}", daemon=True).start()
+        try:
+            task = self.tasks[job_type]
+            with app.app_context():
+                if upload_path is None:
+                    result = task(job_id, None, progress)
+                else:
+                    with open(upload_path, "rb") as stream:
+                        result = task(job_id, FileStorage(stream=stream, filename=upload_filename), progress)
+            self._update(job_id, status=JOB_COMPLETED, result=json.dumps(result, default=str))
+        except Exception as e:
+            self._update(job_id, status=JOB_FAILED, error=str(e))
+            self._remove_files(job_id, output=True)
+        finally:
+            finished.set()
+            self._remove_files(job_id)
+
+    def _update(self, job_id: str, **fields) -> None:
+        """
+        Update columns of a job row.
+
+        Args
+        ----
+        job_id (str): The job ID.
+        **fields: The column values to set.
+
+        Returns
+        -------
+        None
+        """
+        fields["updated_at"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._connect() as connection:
+            connection.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def _remove_files(self, job_id: str, output: bool = False) -> None:
+        """
+        Delete the stored upload of a job, and optionally its exported file.
+
+        Args
+        ----
+        job_id (str): The job ID.
+        output (bool): Whether to delete the exported file too.
+
+        Returns
+        -------
+        None
+        """
+        paths = [os.path.join(self.jobs_folder, f"{job_id}.upload")]
+        if output:
+            paths.append(self.output_path(job_id))
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def recover_stale_jobs(self) -> None:
+        """
+        Requeue running jobs whose process stopped updating them, or fail them after JOB_MAX_ATTEMPTS attempts.
+
+        Args
+        ----
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        1. Called when the manager is created and whenever a worker thread is idle, so jobs of a killed or
+           restarted worker process are picked up by the remaining ones.
+        """
+        now = datetime.now()
+        stale_before = (now - JOB_STALE_AFTER).isoformat()
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND updated_at < ? AND attempts < ?",
+                (JOB_QUEUED, now.isoformat(), JOB_RUNNING, stale_before, JOB_MAX_ATTEMPTS),
+            )
+            failed = [
+                row[0] for row in connection.execute(
+                    "SELECT id FROM jobs WHERE status = ? AND updated_at < ?", (JOB_RUNNING, stale_before)
+                )
+            ]
+            connection.executemany(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ? AND status = ?",
+                [
+                    (JOB_FAILED, "The job was interrupted too many times", now.isoformat(), job_id, JOB_RUNNING)
+                    for job_id in failed
+                ],
+            )
+        for job_id in failed:
+            self._remove_files(job_id, output=True)
+
+    def delete_old_jobs(self) -> None:
+        """
+        Delete finished jobs older than JOB_RETENTION, with their exported files.
+
+        Args
+        ----
+        None
+
+        Returns
+        -------
+        None
+        """
+        deleted_before = (datetime.now() - JOB_RETENTION).isoformat()
+        with self._connect() as connection:
+            job_ids = [
+                row[0] for row in connection.execute(
+                    "SELECT id FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                    (JOB_COMPLETED, JOB_FAILED, deleted_before),
+                )
+            ]
+            connection.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in job_ids])
+        for job_id in job_ids:
+            self._remove_files(job_id, output=True)
+
+    def update_progress(self, job_id: str, **counts) -> None:
+        """
+        Merge progress counts into a job.
+
+        Args
+        ----
+        job_id (str): The job ID.
+        **counts: The progress counts, e.g. rows_parsed=100.
+
+        Returns
+        -------
+        None
+        """
+        with self._connect() as connection:
+            row = connection.execute("SELECT progress FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if not row:
+                raise JobNotFound()
+            progress = json.loads(row[0])
+            progress.update(counts)
+            connection.execute(
+                "UPDATE jobs SET progress = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(progress), datetime.now().isoformat(), job_id),
+            )
+
+    def get_job(self, job_id: str) -> dict:
+        """
+        Get the status, progress and result of a job.
+
+        Args
+        ----
+        job_id (str): The job ID.
+
+        Returns
+        -------
+        dict: The job information.
+
+        Raises
+        ------
+        JobNotFound: If the job is not found.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT id, type, status, progress, result, error, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if not row:
+            raise JobNotFound()
+        return {
+            "id": row[0],
+            "type": row[1],
+            "status": row[2],
+            "progress": json.loads(row[3]),
+            "result": json.loads(row[4]) if row[4] is not None else None,
+            "error": row[5],
+            "created_at": row[6],
+            "updated_at": row[7],
+        }
@@ -2,15 +2,505 @@
 """
 
 # IMPORTS
+import bisect
+import heapq
+import itertools
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, time
+
+
+# CONSTANTS
+MINUTES_PER_SLOT = 5
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+DEFAULT_SCHEDULE_COUNT = 5
+MIN_STUDENTS_PER_PROCESS = 200
 
 
 # SCHEDULER CLASS
 class Scheduler:
     """
+    A class used to check and build student timetables.
     """
     def __init__(self):
         """
+        Initialize the Scheduler class.
+
+        Args
+        ----
+        None
         """
         pass
 
-    
\ No newline at end of file
+    def time_to_minutes(self, value) -> int:
+        """
+        Convert a course time to minutes after midnight.
+
+        Args
+        ----
+        value (str | time): The time, as "HH:MM" or a time object.
+
+        Returns
+        -------
+        int: The number of minutes after midnight.
+        """
+        if isinstance(value, time):
+            return value.hour * 60 + value.minute
+        hours, minutes = value.split(":")[:2]
+        return int(hours) * 60 + int(minutes)
+
+    def day_to_index(self, value) -> int:
+        """
+        Convert a course day to its position in WEEKDAYS.
+
+        Args
+        ----
+        value (str): The day, e.g. "Mon", "MON" or "monday".
+
+        Returns
+        -------
+        int: The index of the day in WEEKDAYS, or None if it is not a known day.
+
+        Notes
+        -----
+        1. Days are matched on their first three letters, ignoring case and surrounding whitespace.
+        """
+        if not isinstance(value, str):
+            return None
+        day = value.strip()[:3].title()
+        return WEEKDAYS.index(day) if day in WEEKDAYS else None
+
+    def find_conflicts(self, courses: list) -> list:
+        """
+        Find the overlapping meetings of different course groupings.
+
+        Args
+        ----
+        courses (list): Serialized courses with course_grouping, day, begin_time, end_time, start_date and end_date.
+
+        Returns
+        -------
+        list: One conflict per overlapping pair of meetings, with the day, the overlapping time window,
+              the two course groupings and the two course IDs.
+
+        Notes
+        -----
+        1. Meetings are grouped by day and swept in order of begin time, keeping a heap of the meetings still
+           in progress ordered by end time, so the cost is O(n log n) plus the number of conflicts.
+        2. Two meetings conflict if their times overlap on the same day and their date ranges overlap.
+        3. Meetings of the same course grouping never conflict with each other.
+        4. Days are compared after normalizing them with day_to_index; unknown days are compared as given.
+
+        Example
+        -------
+        >>> scheduler = Scheduler()
+        >>> scheduler.find_conflicts(courses)
+        ... [{"day": "Mon", "begin_time": "09:30", "end_time": "10:20", "course_groupings": [...], "course_ids": [...]}]
+        """
+        meetings_by_day = {}
+        for course in courses:
+            day = self.day_to_index(course["day"])
+            meetings_by_day.setdefault(WEEKDAYS[day] if day is not None else course["day"], []).append(
+                (self.time_to_minutes(course["begin_time"]), self.time_to_minutes(course["end_time"]), course)
+            )
+        conflicts = []
+        for day, meetings in meetings_by_day.items():
+            meetings.sort(key=lambda meeting: (meeting[0], meeting[1]))
+            in_progress = []
+            for index, (begin, end, course) in enumerate(meetings):
+                while in_progress and in_progress[0][0] <= begin:
+                    heapq.heappop(in_progress)
+                for other_end, _, other in in_progress:
+                    if (
+                        other["course_grouping"] != course["course_grouping"]
+                        and str(other["start_date"]) <= str(course["end_date"])
+                        and str(course["start_date"]) <= str(other["end_date"])
+                    ):
+                        conflicts.append({
+                            "day": day,
+                            "begin_time": course["begin_time"],
+                            "end_time": course["end_time"] if end <= other_end else other["end_time"],
+                            "course_groupings": [other["course_grouping"], course["course_grouping"]],
+                            "course_ids": [other["id"], course["id"]],
+                        })
+                heapq.heappush(in_progress, (end, index, course))
+        return conflicts
+
+    def date_to_ordinal(self, value) -> int:
+        """
+        Convert a course date to its proleptic Gregorian ordinal.
+
+        Args
+        ----
+        value (str | date): The date, as "YYYY-MM-DD" or a date object.
+
+        Returns
+        -------
+        int: The ordinal of the date.
+        """
+        if isinstance(value, date):
+            return value.toordinal()
+        return date.fromisoformat(value[:10]).toordinal()
+
+    def get_date_boundaries(self, courses: list) -> list:
+        """
+        Split the dates spanned by a set of courses into periods in which no course starts or ends.
+
+        Args
+        ----
+        courses (list): The serialized courses.
+
+        Returns
+        -------
+        list: The sorted ordinals at which a period starts (each start date and the day after each end date).
+        """
+        boundaries = set()
+        for course in courses:
+            boundaries.add(self.date_to_ordinal(course["start_date"]))
+            boundaries.add(self.date_to_ordinal(course["end_date"]) + 1)
+        return sorted(boundaries)
+
+    def get_slot_size(self, courses: list) -> int:
+        """
+        Get the largest time slot size that every meeting of a set of courses starts and ends on.
+
+        Args
+        ----
+        courses (list): The serialized courses.
+
+        Returns
+        -------
+        int: The slot size in minutes, a divisor of a day.
+        """
+        slot_size = 24 * 60
+        for course in courses:
+            slot_size = math.gcd(
+                slot_size, self.time_to_minutes(course["begin_time"]), self.time_to_minutes(course["end_time"])
+            )
+        return slot_size
+
+    def encode_time_slots(self, courses: list, date_boundaries: list = None, minutes_per_slot: int = MINUTES_PER_SLOT) -> int:
+        """
+        Encode the meetings of a course grouping as a bitmask of time slots.
+
+        Args
+        ----
+        courses (list): The serialized courses of the grouping.
+        date_boundaries (list): The periods from get_date_boundaries, or None to ignore dates.
+        minutes_per_slot (int): The slot size in minutes, a divisor of a day.
+
+        Returns
+        -------
+        int: A bitmask with one bit per slot of the week, per period, that a meeting touches.
+
+        Notes
+        -----
+        1. Slots are rounded outwards, so disjoint masks guarantee no conflict. Overlapping masks mean a conflict
+           when the slot size comes from get_slot_size and date_boundaries covers all the courses compared.
+        2. Meetings whose day is not a known day (see day_to_index) set no bits.
+        """
+        mask = 0
+        slots_per_day = 24 * 60 // minutes_per_slot
+        week_slots = len(WEEKDAYS) * slots_per_day
+        for course in courses:
+            day = self.day_to_index(course["day"])
+            if day is None:
+                continue
+            begin = self.time_to_minutes(course["begin_time"]) // minutes_per_slot
+            end = math.ceil(self.time_to_minutes(course["end_time"]) / minutes_per_slot)
+            if end <= begin:
+                continue
+            slots = ((1 << (end - begin)) - 1) << (day * slots_per_day + begin)
+            if date_boundaries is None:
+                mask |= slots
+                continue
+            first = bisect.bisect_right(date_boundaries, self.date_to_ordinal(course["start_date"])) - 1
+            last = bisect.bisect_right(date_boundaries, self.date_to_ordinal(course["end_date"])) - 1
+            for period in range(first, last + 1):
+                mask |= slots << (period * week_slots)
+        return mask
+
+    def encode_time_grid(self, courses: list) -> dict:
+        """
+        Encode a course grouping as a weekly time slot bitmask and a date span.
+
+        Args
+        ----
+        courses (list): The serialized courses of the grouping.
+
+        Returns
+        -------
+        dict: The time_slots bitmask (see encode_time_slots) and the first start_date and last end_date as ordinals.
+
+        Notes
+        -----
+        1. Groupings whose grids do not overlap never conflict. Overlapping grids may still not conflict when
+           meetings fall inside a slot or run in different parts of the date span.
+        """
+        if not courses:
+            return {"time_slots": 0, "start_date": 0, "end_date": -1}
+        return {
+            "time_slots": self.encode_time_slots(courses),
+            "start_date": min(self.date_to_ordinal(course["start_date"]) for course in courses),
+            "end_date": max(self.date_to_ordinal(course["end_date"]) for course in courses),
+        }
+
+    def time_grids_overlap(self, time_grid: dict, other_time_grid: dict) -> bool:
+        """
+        Check whether two time grids share a time slot within overlapping date spans.
+
+        Args
+        ----
+        time_grid (dict): A time grid from encode_time_grid.
+        other_time_grid (dict): Another time grid from encode_time_grid.
+
+        Returns
+        -------
+        bool: True if the groupings may conflict.
+        """
+        return bool(
+            time_grid["time_slots"] & other_time_grid["time_slots"]
+            and time_grid["start_date"] <= other_time_grid["end_date"]
+            and other_time_grid["start_date"] <= time_grid["end_date"]
+        )
+
+    def find_grouping_conflicts(self, time_grids: dict, load_courses: callable) -> list:
+        """
+        Find the conflicts between course groupings, loading meetings only for groupings whose time grids overlap.
+
+        Args
+        ----
+        time_grids (dict): course_grouping -> time grid from encode_time_grid.
+        load_courses (callable): Called with a list of course groupings and returns their serialized courses.
+
+        Returns
+        -------
+        list: The conflicts, as returned by find_conflicts.
+        """
+        overlapping = set()
+        course_groupings = list(time_grids)
+        for index, course_grouping in enumerate(course_groupings):
+            for other_course_grouping in course_groupings[index + 1:]:
+                if self.time_grids_overlap(time_grids[course_grouping], time_grids[other_course_grouping]):
+                    overlapping.update((course_grouping, other_course_grouping))
+        if not overlapping:
+            return []
+        return self.find_conflicts(load_courses(sorted(overlapping)))
+
+    def generate_schedules(self, groupings_by_course_code: dict, count: int = DEFAULT_SCHEDULE_COUNT) -> list:
+        """
+        Find the best conflict-free schedules for one student.
+
+        Args
+        ----
+        groupings_by_course_code (dict): course_code -> course_grouping -> serialized courses, with course codes
+                                         in preference priority order and only groupings the student can join.
+        count (int): The maximum number of schedules to return.
+
+        Returns
+        -------
+        list: The schedules, best first. Each has the chosen course_groupings (course code -> grouping)
+              and the unplaced course codes.
+
+        Notes
+        -----
+        1. Schedules placing more course codes rank higher; ties go to the schedule placing higher priorities.
+        2. Each grouping is encoded with encode_time_slots over the date periods and slot size of all candidates,
+           which makes the masks exact: a grouping fits if and only if its mask misses every slot already taken.
+        3. The search is depth first in priority order. A branch is cut as soon as placing every remaining course
+           code that still has a free grouping could not beat the worst of the best schedules found so far.
+
+        Example
+        -------
+        >>> scheduler = Scheduler()
+        >>> scheduler.generate_schedules({"COMP 1510": {...}, "COMP 1537": {...}}, count=1)
+        ... [{"course_groupings": {"COMP 1510": "COMP 1510-A-1", "COMP 1537": "COMP 1537-B-2"}, "unplaced": []}]
+        """
+        course_codes = [course_code for course_code in groupings_by_course_code if groupings_by_course_code[course_code]]
+        candidates = [
+            course for course_code in course_codes
+            for courses in groupings_by_course_code[course_code].values()
+            for course in courses
+        ]
+        date_boundaries = self.get_date_boundaries(candidates)
+        slot_size = self.get_slot_size(candidates)
+        options = [
+            [
+                (course_grouping, self.encode_time_slots(courses, date_boundaries, slot_size))
+                for course_grouping, courses in groupings_by_course_code[course_code].items()
+            ]
+            for course_code in course_codes
+        ]
+        total = len(course_codes)
+        best = []
+        found = itertools.count()
+
+        def search(index: int, chosen: list, occupied: int, placed: int, priority_mask: int) -> None:
+            remaining = total - index
+            if len(best) == count:
+                placeable, placeable_mask = 0, 0
+                for position in range(index, total):
+                    if any(not occupied & option[1] for option in options[position]):
+                        placeable += 1
+                        placeable_mask |= 1 << (total - 1 - position)
+                bound = ((placed + placeable) << total) | priority_mask | placeable_mask
+                if bound <= best[0][0]:
+                    return
+            if index == total:
+                score = (placed << total) | priority_mask
+                schedule = {course_codes[position]: option[0] for position, option in chosen}
+                if len(best) < count:
+                    heapq.heappush(best, (score, next(found), schedule))
+                else:
+                    heapq.heappushpop(best, (score, next(found), schedule))
+                return
+            bit = 1 << (remaining - 1)
+            for option in options[index]:
+                if occupied & option[1]:
+                    continue
+                chosen.append((index, option))
+                search(index + 1, chosen, occupied | option[1], placed + 1, priority_mask | bit)
+                chosen.pop()
+            search(index + 1, chosen, occupied, placed, priority_mask)
+
+        search(0, [], 0, 0, 0)
+        return [
+            {
+                "course_groupings": schedule,
+                "unplaced": [course_code for course_code in groupings_by_course_code if course_code not in schedule],
+            }
+            for _, _, schedule in sorted(best, key=lambda entry: (-entry[0], entry[1]))
+        ]
+
+    def assign_cohort(
+        self,
+        preferences: dict,
+        groupings_by_course_code: dict,
+        remaining_capacity: dict,
+        max_workers: int = None,
+    ) -> tuple:
+        """
+        Assign course groupings to a whole cohort of students.
+
+        Args
+        ----
+        preferences (dict): student_id -> course codes in priority order.
+        groupings_by_course_code (dict): course_code -> course_grouping -> serialized courses, for joinable groupings.
+        remaining_capacity (dict): course_grouping -> number of students it can still take.
+        max_workers (int): The maximum number of worker processes, or None for the number of CPUs.
+
+        Returns
+        -------
+        tuple: student_id -> assigned course groupings, and student_id -> unplaced course codes.
+
+        Notes
+        -----
+        1. Students only compete with students sharing a course code, so the cohort is split into independent
+           groups of students linked by shared course codes and the groups are assigned in a process pool
+           (at most one process per MIN_STUDENTS_PER_PROCESS students).
+        2. Worker processes are spawned rather than forked, because this runs in a job thread of a multithreaded
+           worker and forking a threaded process can deadlock.
+        3. The result is the same as assigning the whole cohort with assign_students in one process.
+
+        Example
+        -------
+        >>> scheduler = Scheduler()
+        >>> scheduler.assign_cohort({"A00000001": ["COMP 1510"]}, {"COMP 1510": {...}}, {"COMP 1510-A-1": 3})
+        ... ({"A00000001": ["COMP 1510-A-1"]}, {"A00000001": []})
+        """
+        parent = {}
+
+        def find(course_code: str) -> str:
+            while parent.setdefault(course_code, course_code) != course_code:
+                parent[course_code] = parent[parent[course_code]]
+                course_code = parent[course_code]
+            return course_code
+
+        for course_codes in preferences.values():
+            for course_code in course_codes[1:]:
+                parent[find(course_code)] = find(course_codes[0])
+        components = {}
+        for student_id, course_codes in preferences.items():
+            key = find(course_codes[0]) if course_codes else None
+            components.setdefault(key, {})[student_id] = course_codes
+        tasks = []
+        for component in components.values():
+            course_codes = {course_code for codes in component.values() for course_code in codes}
+            groupings = {course_code: groupings_by_course_code.get(course_code, {}) for course_code in course_codes}
+            capacity = {
+                course_grouping: remaining_capacity.get(course_grouping, 0)
+                for course_code in course_codes for course_grouping in groupings[course_code]
+            }
+            tasks.append((component, groupings, capacity))
+
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks), len(preferences) // MIN_STUDENTS_PER_PROCESS)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                results = list(executor.map(self.assign_students, *zip(*tasks)))
+        else:
+            results = [self.assign_students(*task) for task in tasks]
+
+        assignments, unplaced = {}, {}
+        for component_assignments, component_unplaced in results:
+            assignments.update(component_assignments)
+            unplaced.update(component_unplaced)
+        return assignments, unplaced
+
+    def assign_students(self, preferences: dict, groupings_by_course_code: dict, remaining_capacity: dict) -> tuple:
+        """
+        Assign course groupings to students in preference rounds.
+
+        Args
+        ----
+        preferences (dict): student_id -> course codes in priority order.
+        groupings_by_course_code (dict): course_code -> course_grouping -> serialized courses, for joinable groupings.
+        remaining_capacity (dict): course_grouping -> number of students it can still take.
+
+        Returns
+        -------
+        tuple: student_id -> assigned course groupings, and student_id -> unplaced course codes.
+
+        Notes
+        -----
+        1. Round r places every student's r-th preference before anyone's (r + 1)-th, so a student's first choice
+           is never displaced by another student's lower-priority choice.
+        2. Students take turns in ID order, reversed every round, so no student always picks first.
+        3. A student gets the grouping with the most remaining capacity among those with room that do not conflict
+           with the groupings already assigned to them (exact time slot masks, see generate_schedules).
+        """
+        preferences = {student_id: list(dict.fromkeys(course_codes)) for student_id, course_codes in preferences.items()}
+        candidates = [
+            course for groupings in groupings_by_course_code.values() for courses in groupings.values() for course in courses
+        ]
+        date_boundaries = self.get_date_boundaries(candidates)
+        slot_size = self.get_slot_size(candidates)
+        masks = {
+            course_grouping: self.encode_time_slots(courses, date_boundaries, slot_size)
+            for groupings in groupings_by_course_code.values()
+            for course_grouping, courses in groupings.items()
+        }
+        capacity = dict(remaining_capacity)
+        occupied = {student_id: 0 for student_id in preferences}
+        assignments = {student_id: [] for student_id in preferences}
+        unplaced = {student_id: [] for student_id in preferences}
+        order = sorted(preferences)
+        rounds = max((len(course_codes) for course_codes in preferences.values()), default=0)
+        for round_number in range(rounds):
+            for student_id in (order if round_number % 2 == 0 else reversed(order)):
+                if round_number >= len(preferences[student_id]):
+                    continue
+                course_code = preferences[student_id][round_number]
+                available = [
+                    course_grouping for course_grouping in groupings_by_course_code.get(course_code, {})
+                    if capacity.get(course_grouping, 0) > 0 and not occupied[student_id] & masks[course_grouping]
+                ]
+                if not available:
+                    unplaced[student_id].append(course_code)
+                    continue
+                course_grouping = max(available, key=lambda grouping: capacity[grouping])
+                capacity[course_grouping] -= 1
+                occupied[student_id] |= masks[course_grouping]
+                assignments[student_id].append(course_grouping)
+        return assignments, unplaced
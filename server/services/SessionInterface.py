@@ -0,0 +1,246 @@
+"""
+"""
+
+# IMPORTS
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from flask_session.sqlalchemy import SqlAlchemySessionInterface
+from sqlalchemy import delete, insert, select, update
+
+
+# CONSTANTS
+SESSION_CACHE_SIZE = 10000
+SESSION_CACHE_MAX_AGE = 30
+SESSION_EXPIRY_REFRESH_INTERVAL = timedelta(days=1)
+SESSION_CLEANUP_INTERVAL = 3600
+SESSION_CLEANUP_BATCH_SIZE = 1000
+
+
+# CACHED SESSION INTERFACE CLASS
+class CachedSessionInterface(SqlAlchemySessionInterface):
+    """
+    A server-side session interface that keeps recently used sessions in a bounded per-process LRU cache in front
+    of the SQL sessions table.
+
+    Sessions are only written back when their data changes or their stored expiry is due for a refresh, and expired
+    sessions are deleted in batches at most once per cleanup interval.
+    """
+    def __init__(
+        self,
+        app,
+        client,
+        table: str,
+        max_size: int = SESSION_CACHE_SIZE,
+        max_age: float = SESSION_CACHE_MAX_AGE,
+        refresh_interval: timedelta = SESSION_EXPIRY_REFRESH_INTERVAL,
+        cleanup_interval: float = SESSION_CLEANUP_INTERVAL,
+        cleanup_batch_size: int = SESSION_CLEANUP_BATCH_SIZE,
+        **kwargs,
+    ):
+        """
+        Initialize the CachedSessionInterface class.
+
+        Args
+        ----
+        app (Flask): The Flask application instance.
+        client (SQLAlchemy): The SQLAlchemy database instance.
+        table (str): The name of the sessions table.
+        max_size (int): The most sessions kept in the cache.
+        max_age (float): The seconds a cached session is trusted before it is read from the table again.
+        refresh_interval (timedelta): How long an unchanged session goes before its stored expiry is pushed back.
+        cleanup_interval (float): The fewest seconds between two cleanups of expired sessions.
+        cleanup_batch_size (int): The most expired sessions deleted by a single statement.
+        **kwargs: Passed on to SqlAlchemySessionInterface.
+
+        Notes
+        -----
+        1. Each worker process has its own cache, so a session deleted by another worker can be served from the cache
+           for at most max_age seconds.
+        """
+        super().__init__(app, client, table=table, **kwargs)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self.cleanup_interval = cleanup_interval
+        self.cleanup_batch_size = cleanup_batch_size
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+        self.last_cleanup = time.monotonic()
+        app.before_request(self._cleanup_expired_sessions)
+
+    def _cache_get(self, store_id: str) -> tuple:
+        """
+        Get a cached session.
+
+        Args
+        ----
+        store_id (str): The store ID of the session.
+
+        Returns
+        -------
+        tuple: The serialized data and the stored expiry, or None if the session is not cached or is stale.
+        """
+        with self.cache_lock:
+            entry = self.cache.get(store_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[2] > self.max_age:
+                del self.cache[store_id]
+                return None
+            self.cache.move_to_end(store_id)
+            return entry[0], entry[1]
+
+    def _cache_set(self, store_id: str, data: bytes, expiry: datetime) -> None:
+        """
+        Cache a session, evicting the least recently used session when the cache is full.
+
+        Args
+        ----
+        store_id (str): The store ID of the session.
+        data (bytes): The serialized session data.
+        expiry (datetime): The expiry stored in the sessions table.
+
+        Returns
+        -------
+        None
+        """
+        with self.cache_lock:
+            self.cache[store_id] = (data, expiry, time.monotonic())
+            self.cache.move_to_end(store_id)
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+    def _retrieve_session_data(self, store_id: str) -> dict:
+        """
+        Get the saved session data, from the cache when possible.
+
+        Args
+        ----
+        store_id (str): The store ID of the session.
+
+        Returns
+        -------
+        dict: The session data, or None if the session does not exist or has expired.
+
+        Notes
+        -----
+        1. Expired sessions are left in the table for the batched cleanup instead of being deleted here.
+        """
+        now = datetime.utcnow()
+        entry = self._cache_get(store_id)
+        if entry is None:
+            table = self.sql_session_model.__table__
+            row = self.client.session.execute(
+                select(table.c.data, table.c.expiry).where(table.c.session_id == store_id)
+            ).first()
+            if row is None or row.expiry is None:
+                return None
+            entry = (bytes(row.data), row.expiry)
+            self._cache_set(store_id, *entry)
+        if entry[1] <= now:
+            return None
+        return self.serializer.decode(entry[0])
+
+    def _upsert_session(self, session_lifetime: timedelta, session, store_id: str) -> None:
+        """
+        Write the session to the table if its data changed or its stored expiry is due for a refresh.
+
+        Args
+        ----
+        session_lifetime (timedelta): The lifetime of the session.
+        session (ServerSideSession): The session.
+        store_id (str): The store ID of the session.
+
+        Returns
+        -------
+        None
+        """
+        expiry = datetime.utcnow() + session_lifetime
+        data = self.serializer.encode(session)
+        entry = self._cache_get(store_id)
+        if entry is not None and entry[0] == data and entry[1] > expiry - self.refresh_interval:
+            return
+        table = self.sql_session_model.__table__
+        try:
+            result = self.client.session.execute(
+                update(table).where(table.c.session_id == store_id).values(data=data, expiry=expiry)
+            )
+            if result.rowcount == 0:
+                self.client.session.execute(insert(table).values(session_id=store_id, data=data, expiry=expiry))
+            self.client.session.commit()
+        except Exception:
+            self.client.session.rollback()
+            with self.cache_lock:
+                self.cache.pop(store_id, None)
+            raise
+        self._cache_set(store_id, data, expiry)
+
+    def _delete_session(self, store_id: str) -> None:
+        """
+        Delete the session from the table and the cache.
+
+        Args
+        ----
+        store_id (str): The store ID of the session.
+
+        Returns
+        -------
+        None
+        """
+        with self.cache_lock:
+            self.cache.pop(store_id, None)
+        super()._delete_session(store_id)
+
+    def _delete_expired_sessions(self) -> None:
+        """
+        Delete expired sessions from the table, a batch at a time.
+
+        Args
+        ----
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        1. IDs are selected before each delete because MySQL does not allow LIMIT in an IN subquery.
+        """
+        table = self.sql_session_model.__table__
+        now = datetime.utcnow()
+        try:
+            while True:
+                session_ids = self.client.session.execute(
+                    select(table.c.id).where(table.c.expiry <= now).limit(self.cleanup_batch_size)
+                ).scalars().all()
+                if session_ids:
+                    self.client.session.execute(delete(table).where(table.c.id.in_(session_ids)))
+                    self.client.session.commit()
+                if len(session_ids) < self.cleanup_batch_size:
+                    break
+        except Exception:
+            self.client.session.rollback()
+            raise
+
+    def _cleanup_expired_sessions(self) -> None:
+        """
+        Delete expired sessions if the cleanup interval has passed since the last cleanup.
+
+        Args
+        ----
+        None
+
+        Returns
+        -------
+        None
+        """
+        now = time.monotonic()
+        with self.cache_lock:
+            if now - self.last_cleanup < self.cleanup_interval:
+                return
+            self.last_cleanup = now
+        self._delete_expired_sessions()
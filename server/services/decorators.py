@@ -39,8 +39,8 @@ def verified_login_required(func: callable) -> callable:
         """
         if "user_id" in session:
             db = current_app.config['database']
-            user = db.get_user_by_id(session.get('user_id'))
-            if user.is_verified:
+            flags = db.get_user_auth_flags(session.get('user_id'))
+            if flags["is_verified"]:
                 return func(*args, **kwargs)
             else:
                 return jsonify({"error": "user not verified"}), 401
@@ -92,8 +92,8 @@ def admin_required(func: callable) -> callable:
         """
         if "user_id" in session:
             db = current_app.config['database']
-            user = db.get_user_by_id(session.get('user_id'))
-            if user.is_admin:
+            flags = db.get_user_auth_flags(session.get('user_id'))
+            if flags["is_admin"]:
                 return func(*args, **kwargs)
             else:
                 return jsonify({"error": "admin required"}), 401
@@ -0,0 +1,270 @@
+"""
+"""
+
+# IMPORTS
+from datetime import date, time
+from sqlalchemy import select
+
+from models.Course import Course
+from models.Student import Student
+from models.Preferences import Preferences
+from models.Enrollments import enrollments
+
+
+# CONSTANTS
+COURSE_COLUMNS = (
+    "id",
+    "status",
+    "block",
+    "crn",
+    "course_grouping",
+    "course_code",
+    "course_type",
+    "day",
+    "begin_time",
+    "end_time",
+    "building_room",
+    "start_date",
+    "end_date",
+    "max_capacity",
+    "num_enrolled",
+    "is_full_time",
+    "term_code",
+    "instructor",
+)
+COURSE_RELATIONSHIPS = ("students",)
+STUDENT_COLUMNS = (
+    "id",
+    "first_name",
+    "last_name",
+    "term_code",
+    "email",
+    "is_completed",
+    "is_approved_by_program_heads",
+)
+STUDENT_RELATIONSHIPS = ("preferences", "courses", "course_codes")
+
+
+# HELPERS
+def format_value(value):
+    """
+    Convert a column value into its JSON representation.
+
+    Args
+    ----
+    value: The column value.
+
+    Returns
+    -------
+    The value, with times formatted as "HH:MM" and dates as "YYYY-MM-DD".
+    """
+    if isinstance(value, time):
+        return value.strftime("%H:%M")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def select_fields(fields: tuple, columns: tuple, relationships: tuple) -> tuple:
+    """
+    Split requested fields into model columns and relationships.
+
+    Args
+    ----
+    fields (tuple): The requested fields, or None for every column and relationship.
+    columns (tuple): The serializable columns of the model.
+    relationships (tuple): The serializable relationships of the model.
+
+    Returns
+    -------
+    tuple: The requested columns and the requested relationships, in model order.
+
+    Raises
+    ------
+    ValueError: If a requested field is not serializable.
+    """
+    if fields is None:
+        return columns, relationships
+    unknown = set(fields) - set(columns) - set(relationships)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return (
+        tuple(column for column in columns if column in fields),
+        tuple(relationship for relationship in relationships if relationship in fields),
+    )
+
+
+def serialize_rows(rows, columns: tuple) -> list:
+    """
+    Build dictionaries from column tuples.
+
+    Args
+    ----
+    rows (iterable): The rows, with values in the same order as columns.
+    columns (tuple): The column names.
+
+    Returns
+    -------
+    list: One dictionary per row.
+
+    Notes
+    -----
+    1. Dates and times repeat across many rows, so each distinct value is only formatted once.
+    """
+    temporal = [
+        index for index, column in enumerate(columns)
+        if column in ("begin_time", "end_time", "start_date", "end_date")
+    ]
+    if not temporal:
+        return [dict(zip(columns, row)) for row in rows]
+    formatted = {}
+    serialized = []
+    for row in rows:
+        values = list(row)
+        for index in temporal:
+            value = values[index]
+            if value not in formatted:
+                formatted[value] = format_value(value)
+            values[index] = formatted[value]
+        serialized.append(dict(zip(columns, values)))
+    return serialized
+
+
+# SERIALIZERS
+def serialize_courses(session, criteria: tuple = (), fields: tuple = None) -> list:
+    """
+    Serialize the courses matching the criteria, ordered by ID.
+
+    Args
+    ----
+    session (Session): The database session.
+    criteria (tuple): SQL expressions the courses must match.
+    fields (tuple): The fields to include, or None for all of COURSE_COLUMNS and COURSE_RELATIONSHIPS.
+
+    Returns
+    -------
+    list: The serialized courses.
+
+    Notes
+    -----
+    1. "students" is the list of enrolled student IDs, loaded for every course with a single query.
+    """
+    columns, relationships = select_fields(fields, COURSE_COLUMNS, COURSE_RELATIONSHIPS)
+    query_columns = columns if "id" in columns else ("id", *columns)
+    rows = session.connection().execute(
+        select(*(getattr(Course, column) for column in query_columns)).where(*criteria).order_by(Course.id)
+    ).all()
+    courses = serialize_rows(rows, query_columns)
+    if "students" in relationships:
+        students = {course["id"]: [] for course in courses}
+        enrolled = session.connection().execute(
+            select(enrollments.c.course_id, enrollments.c.student_id)
+            .where(enrollments.c.course_id.in_(select(Course.id).where(*criteria)))
+            .order_by(enrollments.c.course_id, enrollments.c.student_id)
+        )
+        for course_id, student_id in enrolled:
+            students[course_id].append(student_id)
+        for course in courses:
+            course["students"] = students[course["id"]]
+    if "id" not in columns:
+        for course in courses:
+            del course["id"]
+    return courses
+
+
+def serialize_students(
+    session,
+    criteria: tuple = (),
+    fields: tuple = None,
+    course_fields: tuple = None,
+    include_course_students: bool = False,
+) -> list:
+    """
+    Serialize the students matching the criteria, ordered by ID.
+
+    Args
+    ----
+    session (Session): The database session.
+    criteria (tuple): SQL expressions the students must match.
+    fields (tuple): The fields to include, or None for all of STUDENT_COLUMNS and STUDENT_RELATIONSHIPS.
+    course_fields (tuple): The columns of each enrolled course to include, or None for all of COURSE_COLUMNS.
+    include_course_students (bool): Whether each enrolled course lists the IDs of its students.
+
+    Returns
+    -------
+    list: The serialized students.
+
+    Notes
+    -----
+    1. "courses" maps course code to course grouping to the courses of that grouping.
+    2. Each requested relationship is loaded for all matching students with a single query, and
+       neither the ORM objects nor the session are touched.
+
+    Example
+    -------
+    >>> serialize_students(db.session, (Student.id == "A00000001",), fields=("id", "preferences"))
+    ... [{"id": "A00000001", "preferences": ["COMP 1510", "COMP 1537"]}]
+    """
+    columns, relationships = select_fields(fields, STUDENT_COLUMNS, STUDENT_RELATIONSHIPS)
+    query_columns = columns if "id" in columns else ("id", *columns)
+    rows = session.connection().execute(
+        select(*(getattr(Student, column) for column in query_columns)).where(*criteria).order_by(Student.id)
+    ).all()
+    students = serialize_rows(rows, query_columns)
+    student_ids = select(Student.id).where(*criteria)
+
+    if "preferences" in relationships:
+        preferences = {student["id"]: [] for student in students}
+        for student_id, preference in session.connection().execute(
+            select(Preferences.student_id, Preferences.preference)
+            .where(Preferences.student_id.in_(student_ids))
+            .order_by(Preferences.student_id, Preferences.priority)
+        ):
+            preferences[student_id].append(preference)
+        for student in students:
+            student["preferences"] = preferences[student["id"]]
+
+    if "courses" in relationships or "course_codes" in relationships:
+        course_columns = ()
+        if "courses" in relationships:
+            course_columns, _ = select_fields(course_fields, COURSE_COLUMNS, ())
+        query_course_columns = tuple(
+            dict.fromkeys((*course_columns, "id", "course_code", "course_grouping"))
+        )
+        rows = session.connection().execute(
+            select(enrollments.c.student_id, *(getattr(Course, column) for column in query_course_columns))
+            .join(Course, Course.id == enrollments.c.course_id)
+            .where(enrollments.c.student_id.in_(student_ids))
+            .order_by(enrollments.c.student_id, Course.id)
+        ).all()
+        course_students = {}
+        if include_course_students:
+            for course_id, student_id in session.connection().execute(
+                select(enrollments.c.course_id, enrollments.c.student_id)
+                .where(
+                    enrollments.c.course_id.in_(
+                        select(enrollments.c.course_id).where(enrollments.c.student_id.in_(student_ids))
+                    )
+                )
+                .order_by(enrollments.c.course_id, enrollments.c.student_id)
+            ):
+                course_students.setdefault(course_id, []).append(student_id)
+        student_courses = {student["id"]: {} for student in students}
+        for row, course in zip(rows, serialize_rows((row[1:] for row in rows), query_course_columns)):
+            groupings = student_courses[row.student_id].setdefault(course["course_code"], {})
+            groupings.setdefault(course["course_grouping"], []).append(course)
+            if include_course_students:
+                course["students"] = course_students.get(course["id"], [])
+            for column in ("id", "course_code", "course_grouping"):
+                if column not in course_columns:
+                    del course[column]
+        for student in students:
+            if "courses" in relationships:
+                student["courses"] = student_courses[student["id"]]
+            if "course_codes" in relationships:
+                student["course_codes"] = list(student_courses[student["id"]])
+
+    if "id" not in columns:
+        for student in students:
+            del student["id"]
+    return students
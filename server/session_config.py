@@ -2,9 +2,10 @@
 """
 
 # IMPORTS
-from flask_session import Session
 from datetime import timedelta
 
+from services.SessionInterface import CachedSessionInterface
+
 
 # CONFIGURE SESSIONS
 def configure_sessions(app, db) -> None:
@@ -20,6 +21,10 @@ def configure_sessions(app, db) -> None:
     -------
     None
 
+    Notes
+    -----
+    1. Sessions are stored in the sessions table behind a per-process cache, see CachedSessionInterface.
+
     Disclaimer
     ----------
     This method was created with the assistance of AI tools (GitHub Copilot). All code created is original and has been reviewed and understood by a human developer.
@@ -32,5 +37,10 @@ def configure_sessions(app, db) -> None:
     app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(weeks=2)
     app.config['SESSION_COOKIE_SAMESITE'] = 'None'
     app.config['SESSION_COOKIE_SECURE'] = True
-    Session(app)
+    app.session_interface = CachedSessionInterface(
+        app,
+        db,
+        table=app.config['SESSION_SQLALCHEMY_TABLE'],
+        use_signer=app.config['SESSION_USE_SIGNER'],
+    )
     return
@@ -0,0 +1,126 @@
+"""
+"""
+
+# IMPORTS
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date, time
+
+import pytest
+from flask import Flask
+from sqlalchemy import event, insert
+
+
+# The server modules import each other from the server folder, e.g. "from services.Scheduler import Scheduler"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_config import db
+from models.Course import Course
+from models.Student import Student
+from models.Preferences import Preferences
+from models.Enrollments import enrollments
+from services.Database import Database
+
+
+# FIXTURES
+@pytest.fixture
+def app():
+    """
+    A Flask application backed by an in-memory SQLite database with every table created.
+    """
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def database(app):
+    """
+    A Database service bound to the test application.
+    """
+    return Database(db)
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    A context manager collecting the SQL statements sent to the database while it is open.
+    """
+    @contextmanager
+    def counter():
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+    return counter
+
+
+@pytest.fixture
+def add_students(app):
+    """
+    A function inserting more students, with three preferences each and enrolled in the meetings of two of three
+    course groupings. Returns the new student IDs.
+    """
+    db.session.execute(insert(Course), [
+        {
+            "id": index + 1,
+            "status": "Active",
+            "block": block,
+            "crn": 10000 + index,
+            "course_grouping": f"{block}COMP 1510",
+            "course_code": "COMP 1510",
+            "course_type": "LEC",
+            "day": day,
+            "begin_time": time(9, 30),
+            "end_time": time(10, 20),
+            "building_room": "SW01-1000",
+            "start_date": date(2025, 1, 6),
+            "end_date": date(2025, 4, 11),
+            "max_capacity": 1000,
+            "num_enrolled": 0,
+            "is_full_time": True,
+            "term_code": "202510",
+            "instructor": "John Smith",
+        }
+        for index, (block, day) in enumerate(
+            (block, day) for block in ("1A", "2A", "3A") for day in ("Mon", "Wed")
+        )
+    ])
+
+    def add(count: int) -> list:
+        start = db.session.query(Student).count()
+        student_ids = [f"A{index:08d}" for index in range(start, start + count)]
+        db.session.execute(insert(Student), [
+            {
+                "id": student_id,
+                "first_name": "Jane",
+                "last_name": "Doe",
+                "email": f"{student_id}@my.bcit.ca",
+                "term_code": 202510,
+            }
+            for student_id in student_ids
+        ])
+        db.session.execute(insert(Preferences), [
+            {"student_id": student_id, "priority": priority, "preference": "COMP 1510"}
+            for student_id in student_ids
+            for priority in (1, 2, 3)
+        ])
+        db.session.execute(insert(enrollments), [
+            {"student_id": student_id, "course_id": course_id}
+            for index, student_id in enumerate(student_ids)
+            for course_id in [course_id for course_id in range(1, 7) if (course_id - 1) // 2 != index % 3]
+        ])
+        db.session.commit()
+        db.session.expunge_all()
+        return student_ids
+    return add
@@ -0,0 +1,180 @@
+"""
+"""
+
+# IMPORTS
+import io
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from db_config import db
+from services.Database import Database, DROP_COURSE_COLUMNS
+
+
+# CONSTANTS
+COURSE_UPLOAD_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "templates", "course_upload_template.xlsx"
+)
+
+
+# HELPERS
+def make_course_rows(count: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "Status": ["Active"] * count,
+        "Block": [f"{index}A" for index in range(count)],
+        "CRN": [10000 + index for index in range(count)],
+        "Course": ["COMP 1510"] * count,
+        "Type": ["LEC"] * count,
+        "Day": ["Mon"] * count,
+        "Begin Time": [830] * count,
+        "End Time": [1020] * count,
+        "Instructor": ["John Smith"] * count,
+        "Bldg/Room": ["SW01-1000"] * count,
+        "Start Date": [datetime(2025, 1, 6)] * count,
+        "End Date": [datetime(2025, 4, 11)] * count,
+        "Max.": [30] * count,
+        "Act.": [10] * count,
+        "FT/PT": ["FT"] * count,
+        "Term Code (swvmday)": [202510] * count,
+    })
+
+
+def make_course_upload_file(df: pd.DataFrame) -> io.BytesIO:
+    df = df.rename(columns={"Instructor": " * Instructor \n\n"}).copy()
+    for column in DROP_COURSE_COLUMNS:
+        df[column] = "x"
+    file = io.BytesIO()
+    df.to_excel(file, index=False)
+    file.seek(0)
+    return file
+
+
+def parse_course_upload_file_with_lambda(file) -> pd.DataFrame:
+    """
+    The previous parser, which merged the instructors of each group with a Python lambda over a set.
+    Blank instructors are skipped, where the previous parser failed on them.
+    """
+    df = pd.read_excel(file)
+    df = df.map(lambda x: x.replace("*", "").replace("\n", "").strip() if isinstance(x, str) else x)
+    df.columns = df.columns.map(lambda x: x.replace("*", "").replace("\n", "").strip())
+    df.drop(columns=DROP_COURSE_COLUMNS, inplace=True)
+    df["Instructor"] = df["Instructor"].map(lambda x: " ".join(x.split(", ")[::-1]) if isinstance(x, str) else x)
+    return aggregate_course_instructors_with_lambda(df)
+
+
+def aggregate_course_instructors_with_lambda(df: pd.DataFrame) -> pd.DataFrame:
+    df = (
+        df.groupby([column for column in df.columns if column != "Instructor"])
+        .agg({"Instructor": lambda x: ",".join(set(x.dropna()))})
+        .reset_index()
+    )
+    df["Instructor"] = df["Instructor"].replace("", None)
+    return df
+
+
+def assert_same_courses(df: pd.DataFrame, expected: pd.DataFrame) -> None:
+    """
+    Compare two parsed DataFrames, ignoring the order of the instructors of each course.
+    """
+    columns = [column for column in expected.columns if column != "Instructor"]
+    assert list(df.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(df[columns], expected[columns], check_dtype=False)
+    split = lambda value: set(value.split(",")) if isinstance(value, str) else None
+    assert df["Instructor"].map(split).tolist() == expected["Instructor"].map(split).tolist()
+
+
+# TESTS
+def test_normalize_course_data():
+    courses, invalid_rows = Database(db).normalize_course_data(make_course_rows(3))
+    assert invalid_rows == []
+    assert courses["block"].tolist() == ["0A", "1A", "2A"]
+    assert courses["course_code"].tolist() == ["COMP 151"] * 3
+    assert courses["course_grouping"].tolist() == ["0ACOMP 151", "1ACOMP 151", "2ACOMP 151"]
+    assert courses["instructor"].tolist() == ["John Smith"] * 3
+
+
+def test_normalize_course_data_reports_blank_column_rows():
+    df = make_course_rows(3)
+    df["Instructor"] = float("nan")
+    courses, invalid_rows = Database(db).normalize_course_data(df)
+    assert courses.empty
+    assert [row["crn"] for row in invalid_rows] == [10000, 10001, 10002]
+
+
+def test_normalize_course_data_reports_numeric_column_rows():
+    df = make_course_rows(3)
+    df["Day"] = [1, 2, 3]
+    df["Block"] = ["0A", 1, "2A"]
+    courses, invalid_rows = Database(db).normalize_course_data(df)
+    assert courses.empty
+    assert [row["block"] for row in invalid_rows] == ["0A", 1, "2A"]
+
+
+def test_normalize_course_data_keeps_valid_rows_next_to_invalid_ones():
+    df = make_course_rows(3)
+    df["Bldg/Room"] = ["SW01-1000", None, 1000]
+    courses, invalid_rows = Database(db).normalize_course_data(df)
+    assert courses["crn"].tolist() == [10000]
+    assert [row["crn"] for row in invalid_rows] == [10001, 10002]
+
+
+def test_normalize_course_data_accepts_empty_frame():
+    courses, invalid_rows = Database(db).normalize_course_data(make_course_rows(0))
+    assert courses.empty
+    assert invalid_rows == []
+
+
+def test_parse_course_upload_file_with_blank_instructor_column():
+    df = make_course_rows(2)
+    df["Instructor"] = None
+    database = Database(db)
+    courses, invalid_rows = database.normalize_course_data(database.parse_bulk_course_upload_file(make_course_upload_file(df)))
+    assert courses.empty
+    assert [row["crn"] for row in invalid_rows] == [10000, 10001]
+
+
+def test_parse_course_upload_file_with_numeric_instructor_column():
+    df = make_course_rows(2)
+    df["Instructor"] = [1234, 5678]
+    database = Database(db)
+    courses, invalid_rows = database.normalize_course_data(database.parse_bulk_course_upload_file(make_course_upload_file(df)))
+    assert courses.empty
+    assert [row["crn"] for row in invalid_rows] == [10000, 10001]
+
+
+def test_aggregate_course_instructors_matches_lambda():
+    df = make_course_rows(4)
+    df = pd.concat([df, df.iloc[[0, 0, 1, 2, 2]]], ignore_index=True)
+    df["Instructor"] = [
+        "John Smith", "Jane Doe", "Ann Lee", None,
+        "Bob Ray", "John Smith", "Jane Doe", "Cal Fox", None,
+    ]
+    courses = Database(db).aggregate_course_instructors(df.copy())
+    assert_same_courses(courses, aggregate_course_instructors_with_lambda(df.copy()))
+    assert courses["Instructor"].fillna("").tolist() == ["John Smith,Bob Ray", "Jane Doe", "Ann Lee,Cal Fox", ""]
+
+
+def test_aggregate_course_instructors_keeps_order_of_appearance():
+    df = pd.concat([make_course_rows(1)] * 4, ignore_index=True)
+    df["Instructor"] = ["Cal Fox", "Ann Lee", "Cal Fox", "Bob Ray"]
+    assert Database(db).aggregate_course_instructors(df)["Instructor"].tolist() == ["Cal Fox,Ann Lee,Bob Ray"]
+
+
+def test_parse_course_upload_file_matches_lambda():
+    df = make_course_rows(3)
+    df = pd.concat([df, df.iloc[[0, 0, 2]]], ignore_index=True)
+    df["Instructor"] = ["Smith, John", "Doe, Jane", None, "Lee, Ann", "Smith, John", None]
+    df["Course"] = "*COMP 1510\n"
+    file = make_course_upload_file(df)
+    courses = Database(db).parse_bulk_course_upload_file(file)
+    file.seek(0)
+    assert_same_courses(courses, parse_course_upload_file_with_lambda(file))
+    assert courses["Instructor"].fillna("").tolist() == ["John Smith,Ann Lee", "Jane Doe", ""]
+
+
+def test_parse_course_upload_template_matches_lambda():
+    with open(COURSE_UPLOAD_TEMPLATE, "rb") as file:
+        courses = Database(db).parse_bulk_course_upload_file(file)
+    with open(COURSE_UPLOAD_TEMPLATE, "rb") as file:
+        assert_same_courses(courses, parse_course_upload_file_with_lambda(file))
@@ -0,0 +1,57 @@
+"""
+"""
+
+
+# TESTS
+def test_get_enrollments_by_student(database, add_students):
+    student_ids = add_students(3)
+    assert database.get_enrollments_by_student() == {
+        student_ids[0]: {"2ACOMP 1510", "3ACOMP 1510"},
+        student_ids[1]: {"1ACOMP 1510", "3ACOMP 1510"},
+        student_ids[2]: {"1ACOMP 1510", "2ACOMP 1510"},
+    }
+
+
+def test_get_enrollments_by_student_query_count_does_not_grow(database, add_students, count_queries):
+    add_students(5)
+    with count_queries() as statements:
+        assert len(database.get_enrollments_by_student()) == 5
+    few_students = len(statements)
+
+    add_students(95)
+    with count_queries() as statements:
+        assert len(database.get_enrollments_by_student()) == 100
+    assert len(statements) == few_students == 1
+
+
+def test_get_all_students(database, add_students):
+    student_ids = add_students(2)
+    students = database.get_all_students()
+    assert [student["id"] for student in students] == student_ids
+    assert students[0]["preferences"] == ["COMP 1510"] * 3
+    assert sorted(students[0]["courses"]["COMP 1510"]) == ["2ACOMP 1510", "3ACOMP 1510"]
+    assert sorted(course["day"] for course in students[0]["courses"]["COMP 1510"]["2ACOMP 1510"]) == ["Mon", "Wed"]
+
+
+def test_get_all_students_query_count_does_not_grow(database, add_students, count_queries):
+    add_students(5)
+    with count_queries() as statements:
+        assert len(database.get_all_students()) == 5
+    few_students = len(statements)
+
+    add_students(95)
+    with count_queries() as statements:
+        assert len(database.get_all_students()) == 100
+    assert len(statements) == few_students
+
+
+def test_get_students_page_query_count_does_not_grow(database, add_students, count_queries):
+    add_students(5)
+    with count_queries() as statements:
+        assert len(database.get_students_page(limit=5)["students"]) == 5
+    few_students = len(statements)
+
+    add_students(95)
+    with count_queries() as statements:
+        assert len(database.get_students_page(limit=100)["students"]) == 100
+    assert len(statements) == few_students
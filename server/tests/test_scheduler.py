@@ -0,0 +1,67 @@
+"""
+"""
+
+# IMPORTS
+from services.Scheduler import Scheduler
+
+
+# HELPERS
+def make_course(course_grouping: str, day: str, begin_time: str, end_time: str, id: int = 1) -> dict:
+    return {
+        "id": id,
+        "course_grouping": course_grouping,
+        "day": day,
+        "begin_time": begin_time,
+        "end_time": end_time,
+        "start_date": "2025-01-06",
+        "end_date": "2025-04-11",
+    }
+
+
+# TESTS
+def test_day_to_index_ignores_case_and_whitespace():
+    scheduler = Scheduler()
+    assert [scheduler.day_to_index(day) for day in ("Mon", "MON", "mon", "Thu ", " monday")] == [0, 0, 0, 3, 0]
+    assert scheduler.day_to_index("TBA") is None
+    assert scheduler.day_to_index(None) is None
+
+
+def test_encode_time_slots_normalizes_days():
+    scheduler = Scheduler()
+    assert scheduler.encode_time_slots([make_course("A", "MON", "09:30", "10:20")]) == scheduler.encode_time_slots(
+        [make_course("A", "Mon", "09:30", "10:20")]
+    )
+    assert scheduler.encode_time_slots([make_course("A", "thu ", "09:30", "10:20")]) == scheduler.encode_time_slots(
+        [make_course("A", "Thu", "09:30", "10:20")]
+    )
+
+
+def test_encode_time_slots_gives_unknown_days_no_slots():
+    scheduler = Scheduler()
+    assert scheduler.encode_time_slots([make_course("A", "TBA", "09:30", "10:20")]) == 0
+
+
+def test_mixed_case_days_on_different_days_do_not_conflict():
+    scheduler = Scheduler()
+    groupings_by_course_code = {
+        "COMP 1510": {"COMP 1510-A": [make_course("COMP 1510-A", "MON", "09:30", "10:20", 1)]},
+        "COMP 1537": {"COMP 1537-A": [make_course("COMP 1537-A", "tue", "09:30", "10:20", 2)]},
+        "COMP 1113": {"COMP 1113-A": [make_course("COMP 1113-A", "Wed ", "09:30", "10:20", 3)]},
+    }
+    schedules = scheduler.generate_schedules(groupings_by_course_code, count=1)
+    assert schedules[0]["course_groupings"] == {
+        "COMP 1510": "COMP 1510-A",
+        "COMP 1537": "COMP 1537-A",
+        "COMP 1113": "COMP 1113-A",
+    }
+    assert schedules[0]["unplaced"] == []
+
+
+def test_mixed_case_days_on_the_same_day_conflict():
+    scheduler = Scheduler()
+    courses = [make_course("COMP 1510-A", "Mon", "09:30", "10:20", 1), make_course("COMP 1537-A", "MON", "10:00", "11:20", 2)]
+    time_grids = {course["course_grouping"]: scheduler.encode_time_grid([course]) for course in courses}
+    conflicts = scheduler.find_grouping_conflicts(time_grids, lambda course_groupings: courses)
+    assert len(conflicts) == 1
+    assert conflicts[0]["day"] == "Mon"
+    assert conflicts[0]["course_groupings"] == ["COMP 1510-A", "COMP 1537-A"]